@@ -18,14 +18,164 @@ import numpy as np
 from twitchio.ext import commands
 import asyncio
 import threading
+import queue
+import atexit
+import heapq
+import functools
+import bisect
+from collections import deque, defaultdict
 from concurrent.futures import ThreadPoolExecutor
-import traceback
+import logging
+import logging.handlers
+import hashlib
 import msvcrt  # For Windows file locking
 import psutil
 import shutil
 import sys
 
+log = logging.getLogger(__name__)
+
+def _start_log_listener(path='mugenbot.log'):
+    """Route log records through a queue so file and console output happen on a background thread"""
+    log_queue = queue.Queue(-1)
+    listener = logging.handlers.QueueListener(
+        log_queue,
+        logging.FileHandler(path, encoding='utf-8'),
+        logging.StreamHandler()
+    )
+    root_logger = logging.getLogger()
+    root_logger.addHandler(logging.handlers.QueueHandler(log_queue))
+    root_logger.setLevel(logging.INFO)
+    listener.start()
+    return listener
+
+class _RepeatFilter(logging.Filter):
+    """Drop records from a call site that already logged the same message within the interval"""
+    def __init__(self, interval=1.0):
+        super().__init__()
+        self.interval = interval
+        self._last_times = {}
+
+    def filter(self, record):
+        key = (record.lineno, record.msg)
+        if record.created - self._last_times.get(key, 0.0) < self.interval:
+            return False
+        self._last_times[key] = record.created
+        return True
+
+# Error storms (e.g. a chat flood of bad commands) log each error at most once per second
+log.addFilter(_RepeatFilter())
+
+# Prefer a C-accelerated JSON codec for the larger data files, falling back to stdlib json
+try:
+    import orjson
+
+    def _json_dumps(obj) -> bytes:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+
+    _json_loads = orjson.loads
+except ImportError:
+    try:
+        import ujson as _fast_json
+    except ImportError:
+        _fast_json = json
+
+    def _json_dumps(obj) -> bytes:
+        return _fast_json.dumps(obj, indent=2).encode('utf-8')
+
+    _json_loads = _fast_json.loads
+
+
+def _atomic_write(path: Path, data: bytes):
+    """Write bytes to a temporary file first, then atomically swap it into place"""
+    temp_path = path.with_suffix(path.suffix + '.tmp')
+    with open(temp_path, 'wb') as f:
+        f.write(data)
+    os.replace(temp_path, path)
+
+
+def _json_save(path: Path, obj):
+    """Atomically write an object to a JSON file using the fastest available encoder"""
+    _atomic_write(path, _json_dumps(obj))
+
+
+def _json_load(path):
+    """Read a JSON file using the fastest available decoder"""
+    with open(path, 'rb') as f:
+        return _json_loads(f.read())
+
+
+@functools.lru_cache(maxsize=4096)
+def _win_rate_and_tier(wins: int, losses: int):
+    """Get the formatted win rate and tier for a win/loss record"""
+    total_matches = wins + losses
+    if total_matches == 0:
+        return "0.0%", "Unranked"
+        
+    win_rate = wins / total_matches
+    win_rate_text = f"{win_rate*100:.1f}%"
+    if total_matches < 10:
+        return win_rate_text, "Unranked"
+        
+    if win_rate >= 0.7: return win_rate_text, "S"
+    elif win_rate >= 0.6: return win_rate_text, "A"
+    elif win_rate >= 0.5: return win_rate_text, "B"
+    elif win_rate >= 0.4: return win_rate_text, "C"
+    else: return win_rate_text, "D"
+
+
+# Tier names by win-rate band, for scoring a whole roster at once
+_TIER_NAMES = np.array(["D", "C", "B", "A", "S"])
+_TIER_BOUNDS = [0.4, 0.5, 0.6, 0.7]
+
+
+def _build_placeholder_data(size=200, border=10, fill='#333333', edge='#ffffff'):
+    """Build Tk PhotoImage color data for a square placeholder with a border"""
+    border_row = "{" + " ".join([edge] * size) + "}"
+    middle_row = "{" + " ".join([edge] * border + [fill] * (size - 2 * border) + [edge] * border) + "}"
+    return " ".join([border_row] * border + [middle_row] * (size - 2 * border) + [border_row] * border)
+
+
+# Placeholder pixel data is constant, so build it once at import time
+_PLACEHOLDER_DATA = _build_placeholder_data()
+
+
+class _DefPaths(dict):
+    """Map character or stage names to their .def paths, building unknown names on first use"""
+    def __init__(self, folder, names=()):
+        super().__init__()
+        self.folder = folder
+        for name in names:
+            self[name] = f"{folder}/{name}/{name}.def"
+
+    def __missing__(self, name):
+        path = self[name] = f"{self.folder}/{name}/{name}.def"
+        return path
+
+
+class _Settings(dict):
+    """Battle settings that call on_change whenever one of the watched keys is written"""
+    def __init__(self, values, watched, on_change):
+        super().__init__(values)
+        self.watched = watched
+        self.on_change = on_change
+
+    def __setitem__(self, key, value):
+        super().__setitem__(key, value)
+        if key in self.watched:
+            self.on_change()
+
+    def update(self, *args, **kwargs):
+        super().update(*args, **kwargs)
+        self.on_change()
+
+
 class MugenBattleManager:
+    STATS_SCHEMA_VERSION = 2  # Saved with the stats; older files are validated on load
+    STATS_SAVE_DELAY = 2  # seconds to collect stat updates before writing
+    MUGEN_EXES = frozenset({'mugen.exe', '3v3.exe', '4v4.exe'})  # MUGEN executables to look for
+    CMD_SETTINGS = frozenset({"rounds", "p2_color", "team_size"})  # Settings cached as command-line strings
+    
     def __init__(self):
         # Initialize stats dictionary
         self.stats = {
@@ -38,6 +188,7 @@ class MugenBattleManager:
         self.local_betting_enabled = True
         self.local_betting_active = False
         self.local_bets = {"1": {}, "2": {}}
+        self.local_bet_totals = {"1": 0, "2": 0}
         self.local_user_points = {"Player": 1000}  # Default user with 1000 points
         self.pending_bet_results = False  # Flag to track if there are pending bets to be processed
         
@@ -50,10 +201,9 @@ class MugenBattleManager:
             try:
                 self.stats = self.load_stats(stats_path)
             except Exception as e:
-                print(f"Error loading stats: {e}")
-                traceback.print_exc()
+                log.exception("Error loading stats: %s", e)
         
-        self.mugen_path = Path("mugen.exe").resolve()  # Get absolute path
+        self._mugen_path = Path("mugen.exe").resolve()  # Get absolute path (see mugen_path)
         self.chars_path = Path("chars")
         self.stages_path = Path("stages")
         
@@ -61,13 +211,26 @@ class MugenBattleManager:
         self.watcher_path = Path("MugenWatcher.exe")
         self.watcher_log = Path("MugenWatcher.Log")
         self.watcher_process = None  # Initialize watcher process as None
+        self._watcher_log_pos = 0  # Log offset where results for the current battle begin
+        
+        # Last (time, running) result of the MUGEN process check
+        self._mugen_check_cache = (0.0, False)
         
         # Stats tracking
         self.stats_file = Path("battle_stats.json")
         self.stage_stats_file = Path("stage_stats.json")  # Add separate file for stage stats
+        self.battle_durations = deque(maxlen=1000)  # Last 1000 battle durations, filled by load_stats
         self.character_stats = self.load_stats(self.stats_file)
         self.stage_stats = self.load_stats(self.stage_stats_file) or {}
         
+        # Stat updates mark the stats dirty; a background thread writes them in batches
+        self._stats_lock = threading.Lock()  # Guards the stats dicts while they change or serialize
+        self._stats_save_lock = threading.Lock()  # Serializes writes to the stats files
+        self._stats_dirty = threading.Event()
+        self._matchup_cache = {}  # Formatted matchups by character, dropped when that character fights
+        threading.Thread(target=self._stats_writer, name="stats-writer", daemon=True).start()
+        atexit.register(self.flush_stats)
+        
         # Character and stage cache - MOVED UP
         self.characters = self.scan_characters()
         self.stages = self.scan_stages()  # Initialize stages before using them
@@ -84,8 +247,8 @@ class MugenBattleManager:
                     "total_duration": 0
                 }
         
-        # Battle settings
-        self.settings = {
+        # Battle settings; writes to CMD_SETTINGS rebuild the cached command-line strings
+        self.settings = _Settings({
             "rounds": 1,
             "p2_color": 1,
             "battle_mode": "single",  # single, team, turns
@@ -93,7 +256,8 @@ class MugenBattleManager:
             "continuous_mode": True,
             "enabled_characters": set(self.characters),  # Initially enable all characters
             "enabled_stages": set(self.stages)  # Initially enable all stages
-        }
+        }, self.CMD_SETTINGS, self._refresh_setting_strings)
+        self._refresh_setting_strings()
         
         # Add battle history tracking
         self.battle_history_file = Path("battle_history.json")
@@ -103,31 +267,72 @@ class MugenBattleManager:
         
         # Add battle duration tracking
         self.battle_start_time = None
-        self.battle_durations = []  # List to store battle durations
+
+    @property
+    def enabled_characters(self) -> set:
+        """Set of enabled character names (stored as a set, saved as a list)"""
+        return self.settings["enabled_characters"]
+
+    @property
+    def enabled_stages(self) -> set:
+        """Set of enabled stage names (stored as a set, saved as a list)"""
+        return self.settings["enabled_stages"]
+
+    @property
+    def mugen_path(self) -> Path:
+        """Path to the MUGEN executable; setting it rebuilds the cached base command"""
+        return self._mugen_path
+
+    @mugen_path.setter
+    def mugen_path(self, path):
+        self._mugen_path = Path(path)
+        self._refresh_setting_strings()
+
+    def _refresh_setting_strings(self):
+        """Rebuild the cached string forms of settings used on the MUGEN command line"""
+        settings = self.settings
+        self._rounds_str = str(settings["rounds"])
+        self._p2_color_str = str(settings["p2_color"])
+        self._team_size_str = str(settings["team_size"])
+        self._base_cmd = (str(self.mugen_path), "-rounds", self._rounds_str)
 
     def scan_characters(self) -> List[str]:
-        """Scan for available characters"""
+        """Scan for available characters, sorted by name"""
         chars = []
         for char_dir in self.chars_path.iterdir():
             if char_dir.is_dir():
                 def_file = char_dir / f"{char_dir.name}.def"
                 if def_file.exists():
                     chars.append(char_dir.name)
+        chars.sort()
+        
+        # Build the command-line .def paths once per scan
+        self.character_paths = _DefPaths("chars", chars)
         return chars
 
     def scan_stages(self):
-        """Scan for available stages"""
+        """Scan for available stages, sorted by name"""
         stages = []
-        stages_path = Path("stages")  # Root stages folder
-        if stages_path.exists():
-            # Scan for .def files directly in stages directory and subdirectories
-            for stage_file in stages_path.glob("**/*.def"):
-                # Get the stage name without path or extension
-                stage_name = stage_file.stem
-                # For stages in subdirectories, include the subdirectory name
-                if stage_file.parent != stages_path:
-                    stage_name = f"{stage_file.parent.name}/{stage_name}"
-                stages.append(stage_name)
+        stages_path = "stages"  # Root stages folder
+        if os.path.isdir(stages_path):
+            # Scan for .def files directly in stages directory and subdirectories,
+            # using the directory entries' cached types instead of a stat per file
+            pending = [(stages_path, None)]
+            while pending:
+                folder, folder_name = pending.pop()
+                with os.scandir(folder) as entries:
+                    for entry in entries:
+                        if entry.is_dir(follow_symlinks=False):
+                            pending.append((entry.path, entry.name))
+                        elif entry.name.lower().endswith('.def'):
+                            # Get the stage name without path or extension
+                            stage_name = entry.name[:-4]
+                            # For stages in subdirectories, include the subdirectory name
+                            if folder_name is not None:
+                                stage_name = f"{folder_name}/{stage_name}"
+                            stages.append(stage_name)
+        stages.sort()
+        self.stage_paths = _DefPaths("stages", stages)
         
         print("Found stages:", stages)  # Debug print
         return stages
@@ -135,39 +340,40 @@ class MugenBattleManager:
     def load_stats(self, file_path: Path) -> Dict:
         """Load statistics with validation and repair"""
         try:
-            if not file_path.exists():
+            # A save interrupted between its two renames leaves only the backup
+            if not file_path.exists() and not file_path.with_suffix('.json.bak').exists():
                 print("No stats file found, starting fresh")
                 return {}  # Return empty dict instead of None
             
             # Try to load main file
             try:
-                with open(file_path, 'r') as f:
-                    stats = json.load(f)
+                stats = _json_load(file_path)
             except (json.JSONDecodeError, Exception) as e:
                 print(f"Error loading stats file: {e}")
                 # Try backup
                 backup_path = file_path.with_suffix('.json.bak')
                 if backup_path.exists():
                     print("Attempting to load from backup...")
-                    with open(backup_path, 'r') as f:
-                        stats = json.load(f)
+                    stats = _json_load(backup_path)
                 else:
                     print("No backup found, starting fresh")
                     return {}  # Return empty dict instead of None
             
-            # Validate and repair stats
+            # Files written by this version are already well-formed; only repair older ones
+            trusted = stats.get('schema_version') == self.STATS_SCHEMA_VERSION
             if 'character_stats' in stats:
-                self.character_stats = self._validate_character_stats(stats['character_stats'])
+                self.character_stats = (stats['character_stats'] if trusted
+                                        else self._validate_character_stats(stats['character_stats']))
             if 'stage_stats' in stats:
-                self.stage_stats = self._validate_stage_stats(stats['stage_stats'])
+                self.stage_stats = (stats['stage_stats'] if trusted
+                                    else self._validate_stage_stats(stats['stage_stats']))
             if 'battle_durations' in stats:
-                self.battle_durations = stats['battle_durations'][-1000:]  # Keep last 1000
+                self.battle_durations = deque(stats['battle_durations'], maxlen=1000)  # Keep last 1000
                 
             return stats  # Return the loaded stats
                 
         except Exception as e:
-            print(f"Error loading stats: {e}")
-            traceback.print_exc()
+            log.exception("Error loading stats: %s", e)
             # Start fresh if all else fails
             return {}
     
@@ -203,47 +409,72 @@ class MugenBattleManager:
             validated[stage] = data
         return validated
 
-    def save_stats(self):
-        """Save statistics with backup mechanism"""
+    def _stats_writer(self):
+        """Write the stats shortly after they change, batching bursts of updates"""
+        while True:
+            self._stats_dirty.wait()
+            time.sleep(self.STATS_SAVE_DELAY)
+            self.flush_stats()
+
+    def flush_stats(self):
+        """Write the stats now if there are unsaved updates"""
+        if self._stats_dirty.is_set():
+            self._stats_dirty.clear()
+            if not self.save_stats():
+                # Keep the updates pending so the writer tries again
+                self._stats_dirty.set()
+
+    def save_stats(self) -> bool:
+        """Save statistics with backup mechanism, returning whether the write succeeded"""
         try:
-            # Create backup of existing stats
-            if self.stats_file.exists():
-                backup_path = self.stats_file.with_suffix('.json.bak')
-                import shutil
-                shutil.copy2(self.stats_file, backup_path)
-            
-            # Save current stats with atomic write
-            temp_path = self.stats_file.with_suffix('.json.tmp')
-            stats_data = {
-                'character_stats': self.character_stats,
-                'stage_stats': self.stage_stats,
-                'battle_durations': self.battle_durations[-1000:],  # Keep last 1000 battles
-                'last_save': time.strftime("%Y-%m-%d %H:%M:%S")
-            }
-            
-            # Write to temporary file first
-            with open(temp_path, 'w') as f:
-                json.dump(stats_data, f, indent=2)
+            # Serialize a consistent snapshot while no update is in progress
+            with self._stats_lock:
+                data = _json_dumps({
+                    'schema_version': self.STATS_SCHEMA_VERSION,
+                    'character_stats': self.character_stats,
+                    'stage_stats': self.stage_stats,
+                    'battle_durations': list(self.battle_durations),  # Capped at the last 1000 battles
+                    'last_save': time.strftime("%Y-%m-%d %H:%M:%S")
+                })
             
-            # Atomic rename
-            import os
-            os.replace(temp_path, self.stats_file)
+            with self._stats_save_lock:
+                # Write to a temporary file first
+                temp_path = self.stats_file.with_suffix('.json.tmp')
+                with open(temp_path, 'wb') as f:
+                    f.write(data)
+                
+                # The previous file becomes the backup by rename instead of a copy
+                if self.stats_file.exists():
+                    os.replace(self.stats_file, self.stats_file.with_suffix('.json.bak'))
+                os.replace(temp_path, self.stats_file)
+            return True
             
         except Exception as e:
-            print(f"Error saving stats: {e}")
-            traceback.print_exc()
-            # Try to restore from backup
+            log.exception("Error saving stats: %s", e)
+            # Restore from backup only if the failure left no current stats file
             try:
                 backup_path = self.stats_file.with_suffix('.json.bak')
-                if backup_path.exists():
-                    import shutil
+                if backup_path.exists() and not self.stats_file.exists():
                     shutil.copy2(backup_path, self.stats_file)
                     print("Restored stats from backup")
             except Exception as be:
                 print(f"Error restoring backup: {be}")
+            return False
 
     def update_stats(self, winner: str, loser: str):
         """Update win/loss statistics and matchup tracking"""
+        with self._stats_lock:
+            self._apply_character_result(winner, loser)
+        
+        # Save in the background shortly after
+        self._stats_dirty.set()
+
+    def _apply_character_result(self, winner: str, loser: str):
+        """Record a win and a loss in the character stats"""
+        # Only these two characters' matchups change
+        self._matchup_cache.pop(winner, None)
+        self._matchup_cache.pop(loser, None)
+        
         # Update character stats
         for char in [winner, loser]:
             if char not in self.character_stats:
@@ -279,13 +510,13 @@ class MugenBattleManager:
             self.character_stats[loser]["most_lost_to"][winner] = 0
         self.character_stats[loser]["most_lost_to"][winner] += 1
 
-        # Save immediately after update
-        self.save_stats()
-
     def get_character_matchups(self, char_name: str) -> Dict:
         """Get detailed matchup statistics for a character"""
         if char_name not in self.character_stats:
             return {}
+        cached = self._matchup_cache.get(char_name)
+        if cached is not None:
+            return cached
             
         stats = self.character_stats[char_name]
         matchups = stats.get("matchups", {})
@@ -302,6 +533,7 @@ class MugenBattleManager:
                 "win_rate": f"{win_rate:.1f}%"
             }
             
+        self._matchup_cache[char_name] = detailed_matchups
         return detailed_matchups
 
     def get_most_defeated_opponent(self, char_name: str) -> str:
@@ -328,6 +560,14 @@ class MugenBattleManager:
 
     def update_stage_stats(self, stage: str):
         """Update stage usage statistics"""
+        with self._stats_lock:
+            self._apply_stage_use(stage)
+        
+        # Save in the background shortly after
+        self._stats_dirty.set()
+
+    def _apply_stage_use(self, stage: str):
+        """Record one use of a stage, and the battle duration if known"""
         # Initialize stage stats if not exists or missing keys
         if stage not in self.stage_stats:
             self.stage_stats[stage] = {
@@ -354,9 +594,23 @@ class MugenBattleManager:
             self.stage_stats[stage]["total_duration"] += duration
             self.battle_durations.append(duration)
             self.battle_start_time = None  # Reset for next battle
-        
-        # Save immediately after update
-        self.save_stats()
+
+    def get_all_tiers(self, names) -> Dict[str, str]:
+        """Calculate the tiers of many characters with one vectorized pass"""
+        names = list(names)
+        if not names:
+            return {}
+        stats = self.character_stats
+        empty = {"wins": 0, "losses": 0}
+        records = np.array([(stats.get(name, empty)["wins"], stats.get(name, empty)["losses"])
+                            for name in names], dtype=np.int64)
+        wins, losses = records[:, 0], records[:, 1]
+        totals = wins + losses
+        
+        # Same bands as _win_rate_and_tier; fewer than 10 matches stays unranked
+        tiers = _TIER_NAMES[np.digitize(wins / np.maximum(totals, 1), _TIER_BOUNDS)]
+        tiers = np.where(totals < 10, "Unranked", tiers)
+        return dict(zip(names, tiers.tolist()))
 
     def get_character_tier(self, char_name: str) -> str:
         """Calculate character tier based on win rate"""
@@ -364,17 +618,7 @@ class MugenBattleManager:
             return "Unranked"
             
         stats = self.character_stats[char_name]
-        total_matches = stats["wins"] + stats["losses"]
-        if total_matches < 10:
-            return "Unranked"
-            
-        win_rate = stats["wins"] / total_matches
-        
-        if win_rate >= 0.7: return "S"
-        elif win_rate >= 0.6: return "A"
-        elif win_rate >= 0.5: return "B"
-        elif win_rate >= 0.4: return "C"
-        else: return "D"
+        return _win_rate_and_tier(stats["wins"], stats["losses"])[1]
 
     def start_battle(self, battle_info=None):
         """Start a MUGEN battle with current settings and proper process management"""
@@ -385,32 +629,23 @@ class MugenBattleManager:
 
         # Clean up any existing processes first
         try:
-            subprocess.run('taskkill /F /IM mugen.exe', shell=True, stderr=subprocess.DEVNULL)
-            time.sleep(0.5)  # Wait for process cleanup
-        except:
+            killed = []
+            for proc in psutil.process_iter(['name']):
+                name = proc.info['name']
+                if name and name.lower() == 'mugen.exe':
+                    # The process may have exited or be protected; keep cleaning up the rest
+                    try:
+                        proc.kill()
+                    except psutil.Error:
+                        continue
+                    killed.append(proc)
+            if killed:
+                psutil.wait_procs(killed, timeout=0.5)  # Wait for process cleanup
+        except Exception:
             pass
+        self._mugen_check_cache = (0.0, False)  # Don't reuse a check from before the cleanup
 
-        if self.watcher_process:
-            try:
-                self.watcher_process.terminate()
-                time.sleep(0.5)
-            except:
-                pass
-            self.watcher_process = None
-
-        # Clean up log file
-        if self.watcher_log.exists():
-            try:
-                self.watcher_log.unlink()
-            except PermissionError:
-                print("Warning: Could not delete old log file")
-                time.sleep(0.5)
-            try:
-                self.watcher_log.unlink()
-            except:
-                pass
-
-        # Start MugenWatcher before battle
+        # Make sure MugenWatcher is running (reuses the existing process if alive)
         if not self.ensure_watcher_running():
             raise RuntimeError("Failed to start MugenWatcher")
 
@@ -423,73 +658,49 @@ class MugenBattleManager:
         # Note: Round time must be configured in MUGEN's system.def or fight.def files
         # Command line time parameter is not supported by MUGEN
         
-        # Base command with MUGEN path and rounds
-        cmd = [
-            str(self.mugen_path),
-            "-rounds", str(self.settings["rounds"])
-        ]
-
-        # Add character commands based on battle mode
+        # Base command with MUGEN path and rounds, plus the fighters for this battle mode
+        paths = self.character_paths
+        color = self._p2_color_str
         if battle_info['mode'] == "single":
             # Single mode: Each character has 2 rounds
-            cmd.extend([
-                "-p1", f"chars/{battle_info['p1']}/{battle_info['p1']}.def",
+            cmd = [
+                *self._base_cmd,
+                "-p1", paths[battle_info['p1']],
                 "-p1.ai", "1",
-                "-p2", f"chars/{battle_info['p2']}/{battle_info['p2']}.def",
+                "-p2", paths[battle_info['p2']],
                 "-p2.ai", "1",
-                "-p2.color", str(self.settings["p2_color"])
-            ])
+                "-p2.color", color
+            ]
         elif battle_info['mode'] == "simul":
             # Simul mode: Characters fight simultaneously (max 2 per team)
-            # First character of team 1
-            cmd.extend([
-                "-p1", f"chars/{battle_info['p1'][0]}/{battle_info['p1'][0]}.def",
-                "-p1.ai", "1"
-            ])
-            
-            # First character of team 2
-            cmd.extend([
-                "-p2", f"chars/{battle_info['p2'][0]}/{battle_info['p2'][0]}.def",
+            team1, team2 = battle_info['p1'], battle_info['p2']
+            cmd = [
+                *self._base_cmd,
+                # First character of each team
+                "-p1", paths[team1[0]],
+                "-p1.ai", "1",
+                "-p2", paths[team2[0]],
                 "-p2.ai", "1",
-                "-p2.color", str(self.settings["p2_color"])
-            ])
-            
-            # Additional team 1 members
-            for i, char in enumerate(battle_info['p1'][1:], 3):
-                cmd.extend([
-                    f"-p{i}", f"chars/{char}/{char}.def",
-                    f"-p{i}.ai", "1"
-                ])
-            
-            # Additional team 2 members
-            for i, char in enumerate(battle_info['p2'][1:], 4):
-                cmd.extend([
-                    f"-p{i}", f"chars/{char}/{char}.def",
-                    f"-p{i}.ai", "1",
-                    f"-p{i}.color", str(self.settings["p2_color"])
-                ])
-
-        # Add stage with just the stage name (no path or extension)
-        if battle_info['stage'].startswith('stages/'):
-            stage_name = battle_info['stage'][7:]  # Remove 'stages/' prefix
+                "-p2.color", color,
+                # Additional team 1 members
+                *[arg for i, char in enumerate(team1[1:], 3)
+                  for arg in (f"-p{i}", paths[char], f"-p{i}.ai", "1")],
+                # Additional team 2 members
+                *[arg for i, char in enumerate(team2[1:], 4)
+                  for arg in (f"-p{i}", paths[char], f"-p{i}.ai", "1", f"-p{i}.color", color)]
+            ]
         else:
-            stage_name = battle_info['stage']
-        cmd.extend(["-s", stage_name])
-
-        # Convert command list to string with proper quoting
-        cmd_str = f'"{cmd[0]}"'  # Quote the executable path
-        for arg in cmd[1:]:
-            # Quote any argument that contains spaces
-            if ' ' in str(arg):
-                cmd_str += f' "{arg}"'
-            else:
-                cmd_str += f' {arg}'
+            cmd = list(self._base_cmd)
+
+        # Add stage with just the stage name; stored names never carry the 'stages/' prefix
+        cmd.extend(["-s", battle_info['stage']])
 
-        print("Running command:", cmd_str)
+        print("Running command:", subprocess.list2cmdline(cmd))
 
+        process = None
         try:
-            # Start MUGEN process
-            process = subprocess.Popen(cmd_str, shell=True, cwd=str(self.mugen_path.parent))
+            # Start MUGEN process directly; the argument list is quoted by subprocess
+            process = subprocess.Popen(cmd, cwd=str(self.mugen_path.parent))
             
             # Give more time for the process to start and be detected
             start_time = time.time()
@@ -520,8 +731,7 @@ class MugenBattleManager:
                 return battle_info
                 
         except Exception as e:
-            print(f"Error starting battle: {e}")
-            traceback.print_exc()
+            log.exception("Error starting battle: %s", e)
             # Clean up on error
             if process:
                 try:
@@ -532,22 +742,26 @@ class MugenBattleManager:
 
     def _check_mugen_running(self):
         """Check if any MUGEN process is running"""
+        # Reuse a very recent answer; the result poll asks several times per check
+        checked_at, running = self._mugen_check_cache
+        now = time.monotonic()
+        if now - checked_at < 0.2:
+            return running
+            
         try:
-            # Check for all possible MUGEN executables
-            mugen_exes = ['mugen.exe', 'Mugen.exe', '3v3.exe', '4v4.exe']  # Added Mugen.exe variant
-            for exe in mugen_exes:
-                result = subprocess.run(
-                    f'tasklist /FI "IMAGENAME eq {exe}" /NH', 
-                    shell=True, 
-                    capture_output=True, 
-                    text=True
-                )
-                if exe.lower() in result.stdout.lower():  # Case-insensitive check
-                    return True
-            return False
+            # Check for all possible MUGEN executables in one pass over the process table
+            running = False
+            for proc in psutil.process_iter(['name']):
+                name = proc.info['name']
+                if name and name.lower() in self.MUGEN_EXES:
+                    running = True
+                    break
         except Exception as e:
             print(f"Error checking MUGEN process: {e}")
-            return False
+            running = False
+            
+        self._mugen_check_cache = (now, running)
+        return running
 
     def check_battle_result(self) -> Optional[Dict]:
         """Check the result of the current battle"""
@@ -557,39 +771,21 @@ class MugenBattleManager:
         # Check if MUGEN is still running
         mugen_running = self._check_mugen_running()
         
-        if not mugen_running:
-            # Try to get final result
-            result = self._read_battle_result()
-            
-            # Clean up watcher with proper termination
-            if self.watcher_process:
-                try:
-                    self.watcher_process.terminate()
-                    # Wait up to 3 seconds for process to terminate
-                    for _ in range(30):
-                        if self.watcher_process.poll() is not None:
-                            break
-                        time.sleep(0.1)
-                    if self.watcher_process.poll() is None:
-                        self.watcher_process.kill()  # Force kill if not terminated
-                except Exception as e:
-                    print(f"Error terminating watcher: {e}")
-                self.watcher_process = None
-
-            if result:
-                # Process the result before clearing current_battle
-                processed_result = self._process_battle_result(result)
-                return processed_result
-            
-            # Only clear current battle if no result was found
-            self.current_battle = None
-            return None
-
-        # MUGEN is still running, check for results
+        # Check for results, or the final result once MUGEN has exited
         result = self._read_battle_result()
+        if result or not mugen_running:
+            return self.apply_battle_result(result)
+        
+        return None
+
+    def apply_battle_result(self, result) -> Optional[Dict]:
+        """Process a raw result from _read_battle_result, or drop the battle if MUGEN exited without one"""
         if result:
+            # Process the result before clearing current_battle
             return self._process_battle_result(result)
         
+        # Only clear current battle if no result was found
+        self.current_battle = None
         return None
 
     def _process_battle_result(self, result) -> Dict:
@@ -680,16 +876,8 @@ class MugenBattleManager:
 
     def _cleanup_battle(self):
         """Clean up after a battle is complete"""
-        if self.watcher_log.exists():
-            try:
-                self.watcher_log.unlink()
-            except PermissionError:
-                print("Warning: Could not delete watcher log")
-                time.sleep(0.5)  # Wait briefly and try again
-                try:
-                    self.watcher_log.unlink()
-                except:
-                    pass
+        # Skip past this battle's result instead of deleting the log the watcher holds open
+        self._mark_watcher_log()
         
         self.current_battle = None
         self._battle_processed = False  # Reset processed flag for next battle
@@ -703,22 +891,20 @@ class MugenBattleManager:
             except:
                 pass
 
-        p1 = random.choice(enabled_chars)
-        p2 = random.choice([c for c in enabled_chars if c != p1])
+        p1, p2 = random.sample(enabled_chars, 2)
 
         # Create stage path with proper escaping for spaces
-        stage_path = f"stages/{stage}/{stage}.def"
+        stage_path = self.stage_paths[stage]
         if " " in stage_path:
             stage_path = f'"{stage_path}"'
 
         cmd = [
-            str(self.mugen_path),
-            "-rounds", str(self.settings["rounds"]),
+            *self._base_cmd,
             "-p1.ai", "1",
-            f"chars/{p1}/{p1}.def",
+            self.character_paths[p1],
             "-p2.ai", "1",
-            f"chars/{p2}/{p2}.def",
-            "-p2.color", str(self.settings["p2_color"]),
+            self.character_paths[p2],
+            "-p2.color", self._p2_color_str,
             "-s", stage_path
         ]
 
@@ -751,37 +937,36 @@ class MugenBattleManager:
         if len(enabled_chars) < self.settings["team_size"] * 2:
             raise ValueError(f"Not enough characters for {self.settings['team_size']}v{self.settings['team_size']} team battle!")
 
-        # Select teams
-        team1 = random.sample(enabled_chars, self.settings["team_size"])
-        remaining_chars = [c for c in enabled_chars if c not in team1]
-        team2 = random.sample(remaining_chars, self.settings["team_size"])
+        # Select both teams in one draw without replacement
+        team_size = self.settings["team_size"]
+        picked = random.sample(enabled_chars, team_size * 2)
+        team1, team2 = picked[:team_size], picked[team_size:]
 
         # Create stage path with proper escaping for spaces
-        stage_path = f"stages/{stage}/{stage}.def"
+        stage_path = self.stage_paths[stage]
         if " " in stage_path:
             stage_path = f'"{stage_path}"'
 
         cmd = [
-            str(self.mugen_path),
-            "-rounds", str(self.settings["rounds"]),
+            *self._base_cmd,
             "-p1.ai", "1",
-            "-p1.teammember", str(self.settings["team_size"]),
+            "-p1.teammember", self._team_size_str,
         ]
 
         # Add team 1 members
         for char in team1:
-            cmd.extend([f"chars/{char}/{char}.def"])
+            cmd.append(self.character_paths[char])
 
         # Add team 2 configuration
         cmd.extend([
             "-p2.ai", "1",
-            "-p2.teammember", str(self.settings["team_size"]),
-            "-p2.color", str(self.settings["p2_color"]),
+            "-p2.teammember", self._team_size_str,
+            "-p2.color", self._p2_color_str,
         ])
 
         # Add team 2 members
         for char in team2:
-            cmd.extend([f"chars/{char}/{char}.def"])
+            cmd.append(self.character_paths[char])
 
         # Add stage with proper path
         cmd.extend(["-s", stage_path])
@@ -802,38 +987,37 @@ class MugenBattleManager:
         if len(enabled_chars) < self.settings["team_size"] * 2:
             raise ValueError(f"Not enough characters for {self.settings['team_size']}v{self.settings['team_size']} turns battle!")
 
-        # Select teams
-        team1 = random.sample(enabled_chars, self.settings["team_size"])
-        remaining_chars = [c for c in enabled_chars if c not in team1]
-        team2 = random.sample(remaining_chars, self.settings["team_size"])
+        # Select both teams in one draw without replacement
+        team_size = self.settings["team_size"]
+        picked = random.sample(enabled_chars, team_size * 2)
+        team1, team2 = picked[:team_size], picked[team_size:]
 
         # Create stage path with proper escaping for spaces
-        stage_path = f"stages/{stage}/{stage}.def"
+        stage_path = self.stage_paths[stage]
         if " " in stage_path:
             stage_path = f'"{stage_path}"'
 
         cmd = [
-            str(self.mugen_path),
-            "-rounds", str(self.settings["rounds"]),
+            *self._base_cmd,
             "-p1.ai", "1",
-            "-p1.teammember", str(self.settings["team_size"]),
+            "-p1.teammember", self._team_size_str,
             "-tmode", "turns"
         ]
 
         # Add team 1 members
         for char in team1:
-            cmd.extend([f"chars/{char}/{char}.def"])
+            cmd.append(self.character_paths[char])
 
         # Add team 2 configuration
         cmd.extend([
             "-p2.ai", "1",
-            "-p2.teammember", str(self.settings["team_size"]),
-            "-p2.color", str(self.settings["p2_color"]),
+            "-p2.teammember", self._team_size_str,
+            "-p2.color", self._p2_color_str,
         ])
 
         # Add team 2 members
         for char in team2:
-            cmd.extend([f"chars/{char}/{char}.def"])
+            cmd.append(self.character_paths[char])
 
         # Add stage with proper path
         cmd.extend(["-s", stage_path])
@@ -859,14 +1043,12 @@ class MugenBattleManager:
         if len(enabled_chars) < total_chars_needed:
             raise ValueError(f"Not enough characters for {team1_size}v{team2_size} simul battle!")
 
-        # Select teams
-        team1 = random.sample(enabled_chars, team1_size)
-        remaining_chars = [c for c in enabled_chars if c not in team1]
-        team2 = random.sample(remaining_chars, team2_size)
+        # Select both teams in one draw without replacement
+        picked = random.sample(enabled_chars, total_chars_needed)
+        team1, team2 = picked[:team1_size], picked[team1_size:]
 
         cmd = [
-            str(self.mugen_path),
-            "-rounds", str(self.settings["rounds"]),
+            *self._base_cmd,
         ]
 
         # Add team 1 configuration
@@ -879,7 +1061,7 @@ class MugenBattleManager:
         life_mult = max(1.0, team2_size / team1_size)
         for i, char in enumerate(team1):
             cmd.extend([
-                f"chars/{char}/{char}.def",
+                self.character_paths[char],
                 f"-p1.life.{i+1}", str(life_mult)
             ])
 
@@ -887,14 +1069,14 @@ class MugenBattleManager:
         cmd.extend([
             "-p2.ai", "1",
             "-p2.simul", str(team2_size),
-            "-p2.color", str(self.settings["p2_color"]),
+            "-p2.color", self._p2_color_str,
         ])
 
         # Add team 2 members with life multipliers for balance
         life_mult = max(1.0, team1_size / team2_size)
         for i, char in enumerate(team2):
             cmd.extend([
-                f"chars/{char}/{char}.def",
+                self.character_paths[char],
                 f"-p2.life.{i+1}", str(life_mult)
             ])
 
@@ -924,6 +1106,10 @@ class MugenBattleManager:
                 # Acquire lock for reading
                 msvcrt.locking(f.fileno(), msvcrt.LK_NBLCK, 1)
                 try:
+                    # Only read lines written since the current battle started
+                    if os.fstat(f.fileno()).st_size < self._watcher_log_pos:
+                        self._watcher_log_pos = 0  # Log was truncated or recreated
+                    f.seek(self._watcher_log_pos)
                     lines = f.readlines()
                 finally:
                     # Release lock
@@ -977,15 +1163,13 @@ class MugenBattleManager:
             print(f"Error reading battle result: {e}")
             return None
         except Exception as e:
-            print(f"Error reading battle result: {e}")
-            traceback.print_exc()
+            log.exception("Error reading battle result: %s", e)
             return None
 
     def load_battle_history(self) -> Dict:
         """Load battle history from JSON"""
         if self.battle_history_file.exists():
-            with open(self.battle_history_file) as f:
-                return json.load(f)
+            return _json_load(self.battle_history_file)
         return {
             "battles": [],
             "last_save": None
@@ -993,8 +1177,7 @@ class MugenBattleManager:
 
     def save_battle_history(self):
         """Save battle history to file"""
-        with open(self.battle_history_file, 'w') as f:
-            json.dump(self.battle_history, f, indent=2)
+        _json_save(self.battle_history_file, self.battle_history)
     
     def record_battle(self, battle_result: Dict):
         """Record battle result in history"""
@@ -1025,6 +1208,7 @@ class MugenBattleManager:
         """Start local betting period"""
         self.local_betting_active = True
         self.local_bets = {"1": {}, "2": {}}
+        self.local_bet_totals = {"1": 0, "2": 0}
         return True
     
     def place_local_bet(self, username: str, team: str, amount: int) -> bool:
@@ -1048,21 +1232,22 @@ class MugenBattleManager:
             return False
             
         # Create user if doesn't exist
-        if username not in self.local_user_points:
-            self.local_user_points[username] = 1000
+        points = self.local_user_points.setdefault(username, 1000)
             
         # Check if user has enough points
-        if amount > self.local_user_points[username]:
+        if amount > points:
             return False
             
         # Remove any existing bet
-        for team_bets in self.local_bets.values():
+        for bet_team, team_bets in self.local_bets.items():
             if username in team_bets:
                 old_bet = team_bets.pop(username)
                 self.local_user_points[username] += old_bet
+                self.local_bet_totals[bet_team] -= old_bet
                 
         # Place new bet
         self.local_bets[team][username] = amount
+        self.local_bet_totals[team] += amount
         self.local_user_points[username] -= amount
         return True
         
@@ -1070,7 +1255,7 @@ class MugenBattleManager:
         """End local betting period"""
         self.local_betting_active = False
         # Set pending flag if there are any bets to process
-        if self.local_bets["1"] or self.local_bets["2"]:
+        if self.local_bet_totals["1"] or self.local_bet_totals["2"]:
             self.pending_bet_results = True
             print("Betting closed with pending bets to process")
         
@@ -1096,8 +1281,8 @@ class MugenBattleManager:
         self.pending_bet_results = False
         
         # Calculate pools
-        winning_pool = sum(self.local_bets[winning_team].values())
-        losing_pool = sum(self.local_bets[losing_team].values())
+        winning_pool = self.local_bet_totals[winning_team]
+        losing_pool = self.local_bet_totals[losing_team]
         
         print(f"Winning pool: {winning_pool}, Losing pool: {losing_pool}")
         
@@ -1115,6 +1300,7 @@ class MugenBattleManager:
             # Reset betting state
             self.local_betting_active = False
             self.local_bets = {"1": {}, "2": {}}
+            self.local_bet_totals = {"1": 0, "2": 0}
             return results
             
         # Calculate payout ratio (minimum 1.1x)
@@ -1145,6 +1331,7 @@ class MugenBattleManager:
         # Reset betting state
         self.local_betting_active = False
         self.local_bets = {"1": {}, "2": {}}
+        self.local_bet_totals = {"1": 0, "2": 0}
         
         print(f"Final results: {results}")
         print(f"Updated user points: {self.local_user_points}")
@@ -1157,8 +1344,8 @@ class MugenBattleManager:
         Returns:
             Dict: Current betting statistics
         """
-        team1_total = sum(self.local_bets["1"].values())
-        team2_total = sum(self.local_bets["2"].values())
+        team1_total = self.local_bet_totals["1"]
+        team2_total = self.local_bet_totals["2"]
         total_pool = team1_total + team2_total
         
         # Calculate potential payouts
@@ -1174,23 +1361,50 @@ class MugenBattleManager:
             "team2_payout": team2_payout
         }
         
-    def ensure_watcher_running(self):
-        """Ensure MugenWatcher is running and properly initialized"""
+    def _watcher_healthy(self):
+        """Check if the MugenWatcher process is still alive"""
+        return self.watcher_process is not None and self.watcher_process.poll() is None
+
+    def _mark_watcher_log(self):
+        """Remember the current end of the watcher log so old results are ignored"""
         try:
+            self._watcher_log_pos = self.watcher_log.stat().st_size
+        except OSError:
+            self._watcher_log_pos = 0
+
+    def stop_watcher(self):
+        """Terminate the MugenWatcher process if it is running"""
+        if self.watcher_process:
+            try:
+                self.watcher_process.terminate()
+                # Wait up to 3 seconds for process to terminate
+                for _ in range(30):
+                    if self.watcher_process.poll() is not None:
+                        break
+                    time.sleep(0.1)
+                if self.watcher_process.poll() is None:
+                    self.watcher_process.kill()  # Force kill if not terminated
+            except Exception as e:
+                print(f"Error terminating watcher: {e}")
+            self.watcher_process = None
+
+    def ensure_watcher_running(self, restart=False):
+        """Ensure MugenWatcher is running and properly initialized
+        
+        Args:
+            restart: Force a fresh watcher process even if the current one is alive
+            
+        Returns:
+            bool: True if the watcher is running
+        """
+        try:
+            # Reuse the running watcher, only skipping past results already in the log
+            if not restart and self._watcher_healthy():
+                self._mark_watcher_log()
+                return True
+            
             # Kill any existing watcher process
-            if self.watcher_process:
-                try:
-                    self.watcher_process.terminate()
-                    # Wait up to 3 seconds for process to terminate
-                    for _ in range(30):
-                        if self.watcher_process.poll() is not None:
-                            break
-                        time.sleep(0.1)
-                    if self.watcher_process.poll() is None:
-                        self.watcher_process.kill()  # Force kill if not terminated
-                except Exception as e:
-                    print(f"Error terminating watcher: {e}")
-                self.watcher_process = None
+            self.stop_watcher()
 
             # Clean up old log file
             if self.watcher_log.exists():
@@ -1215,6 +1429,7 @@ class MugenBattleManager:
                     [str(self.watcher_path)],
                     creationflags=subprocess.CREATE_NEW_CONSOLE
                 )
+                self._watcher_log_pos = 0
                 # Wait up to 5 seconds for watcher to initialize
                 for _ in range(50):
                     if self.watcher_log.exists():
@@ -1226,8 +1441,7 @@ class MugenBattleManager:
                 return False
 
         except Exception as e:
-            print(f"Error in ensure_watcher_running: {e}")
-            traceback.print_exc()
+            log.exception("Error in ensure_watcher_running: %s", e)
             return False
 
     def prepare_battle(self):
@@ -1250,8 +1464,9 @@ class MugenBattleManager:
         # Prepare battle info based on mode
         if battle_mode == "single":
             # Select two different characters
-            p1 = random.choice(enabled_chars)
-            p2 = random.choice([c for c in enabled_chars if c != p1])
+            if len(enabled_chars) < 2:
+                raise ValueError("At least two characters must be enabled!")
+            p1, p2 = random.sample(enabled_chars, 2)
             battle_info = {
                 "mode": "single",
                 "p1": p1,
@@ -1265,9 +1480,8 @@ class MugenBattleManager:
             if len(enabled_chars) < team_size * 2:
                 raise ValueError(f"Not enough characters for {team_size}v{team_size} simul battle!")
             
-            team1 = random.sample(enabled_chars, team_size)
-            remaining_chars = [c for c in enabled_chars if c not in team1]
-            team2 = random.sample(remaining_chars, team_size)
+            picked = random.sample(enabled_chars, team_size * 2)
+            team1, team2 = picked[:team_size], picked[team_size:]
             
             battle_info = {
                 "mode": "simul",
@@ -1295,7 +1509,15 @@ class MugenBattleManager:
 
 
 class TwitchBot(commands.Bot):
-    def __init__(self, token, channel, battle_gui, bot_name):
+    # Twitch chat limits: messages allowed per window, higher when the bot is a moderator
+    CHAT_RATE_MSGS = 20
+    CHAT_RATE_MOD_MSGS = 100
+    CHAT_RATE_WINDOW = 30  # seconds
+    ANNOUNCE_RESERVE = 5  # Messages held back from command replies for announcements
+    MAX_MESSAGE_CHARS = 500  # Twitch chat message length limit
+    MESSAGE_SEPARATOR = " | "  # Joins queued messages packed into one chat line
+    
+    def __init__(self, token, channel, battle_gui, bot_name, loop=None):
         # Initialize file paths
         self.user_points_file = Path("twitch_user_points.json")
         
@@ -1304,6 +1526,8 @@ class TwitchBot(commands.Bot):
         self.battle_gui = battle_gui
         self.betting_active = False
         self.current_bets = {"1": {}, "2": {}}
+        self.team_totals = {"1": 0, "2": 0}
+        self._bet_team_of = {}  # Maps each bettor to the team they bet on
         self.user_points = self.load_user_points()
         self.commands_list = [
             "!bet [team] [amount] - Place a bet on team 1 or 2",
@@ -1311,6 +1535,7 @@ class TwitchBot(commands.Bot):
             "!help - Show this help message",
             "!stats - Show current battle stats"
         ]
+        self._help_text = "Available commands:\n" + "\n".join(self.commands_list)
         
         # Add connection state tracking
         self.connected = False
@@ -1318,14 +1543,30 @@ class TwitchBot(commands.Bot):
         self.MAX_RETRIES = 3
         self.last_connection_attempt = 0
         self.RETRY_DELAY = 60  # seconds between retry attempts
+        
+        # Outgoing chat messages are queued and packed into as few lines as possible on the next flush
+        self._outbox = deque()
+        
+        # Command replies are queued and drained by a single writer task
+        self._out_queue = asyncio.Queue()
+        self._writer_task = None
+        
+        # Token bucket shared by every chat write; replies leave ANNOUNCE_RESERVE for announcements (see _send_line)
+        self._is_mod = False
+        self._send_tokens = float(self.CHAT_RATE_MSGS)
+        self._send_refill_at = time.monotonic()
+        
+        # Bets mark points dirty; a background task writes them periodically
+        self._points_dirty = False
+        self._save_task = None
+        self.POINTS_SAVE_INTERVAL = 5  # seconds between point saves
 
         # Initialize the bot
         try:
-            super().__init__(token=token, prefix='!', initial_channels=[channel], nick=bot_name)
+            super().__init__(token=token, prefix='!', initial_channels=[channel], nick=bot_name, loop=loop)
             self.channel = None
         except Exception as e:
-            print(f"Failed to initialize Twitch bot: {e}")
-            traceback.print_exc()
+            log.exception("Failed to initialize Twitch bot: %s", e)
             raise
 
     async def event_ready(self):
@@ -1333,6 +1574,12 @@ class TwitchBot(commands.Bot):
         try:
             print(f"Bot is ready! Logged in as {self.nick}")
             
+            # Start the background point saver and reply writer once
+            if self._save_task is None:
+                self._save_task = asyncio.create_task(self._point_saver())
+            if self._writer_task is None:
+                self._writer_task = asyncio.create_task(self._reply_writer())
+            
             # Wait for WebSocket connection
             await asyncio.sleep(2)
             
@@ -1342,32 +1589,35 @@ class TwitchBot(commands.Bot):
             
             if self.channel:
                 print(f"Successfully connected to channel: {self.channel_name}")
+                
+                # Moderators get a higher chat rate limit
+                chatter = self.channel.get_chatter(self.nick.lower())
+                self._is_mod = bool(getattr(chatter, 'is_mod', False))
+                
                 self.connected = True
                 self.connection_retries = 0
                 if self.battle_gui:
-                    self.battle_gui.root.after(0, self.battle_gui.update_twitch_status, True)
-                await self._connection.send(f"PRIVMSG #{self.channel_name} :MugenBattleBot connected! Type !help for commands")
+                    self.battle_gui.post_twitch_event("status", True)
+                await self._send_line(f"PRIVMSG #{self.channel_name} :MugenBattleBot connected! Type !help for commands")
             else:
                 print(f"Could not connect to channel: {self.channel_name}")
                 self.connected = False
                 if self.battle_gui:
-                    self.battle_gui.root.after(0, self.battle_gui.update_twitch_status, False)
+                    self.battle_gui.post_twitch_event("status", False)
                     
         except Exception as e:
-            print(f"Error in event_ready: {e}")
-            traceback.print_exc()
+            log.exception("Error in event_ready: %s", e)
             self.connected = False
             if self.battle_gui:
-                self.battle_gui.root.after(0, self.battle_gui.update_twitch_status, False)
+                self.battle_gui.post_twitch_event("status", False)
 
     async def event_error(self, error: Exception, data: Optional[str] = None):
         """Handle connection errors"""
-        print(f"Twitch bot error: {error}")
-        traceback.print_exc()
+        log.error("Twitch bot error: %s", error, exc_info=error)
         
         self.connected = False
         if self.battle_gui:
-            self.battle_gui.root.after(0, self.battle_gui.update_twitch_status, False)
+            self.battle_gui.post_twitch_event("status", False)
         
         # Attempt reconnection if appropriate
         current_time = time.time()
@@ -1391,29 +1641,33 @@ class TwitchBot(commands.Bot):
             # Reset and initialize betting
             self.betting_active = True
             self.current_bets = {"1": {}, "2": {}}
-            
-            # Announce battle and betting with timeout
-            async with asyncio.timeout(5):  # 5 second timeout for announcements
-                await self._connection.send(f"PRIVMSG #{self.channel_name} :🎲 NEW BATTLE BETTING STARTED! 🎲")
-                await self._connection.send(f"PRIVMSG #{self.channel_name} :⚔️ {title}")
-                await self._connection.send(f"PRIVMSG #{self.channel_name} :Team 1: {option1}")
-                await self._connection.send(f"PRIVMSG #{self.channel_name} :Team 2: {option2}")
-                await self._connection.send(f"PRIVMSG #{self.channel_name} :Type !bet 1 <amount> to bet on Team 1")
-                await self._connection.send(f"PRIVMSG #{self.channel_name} :Type !bet 2 <amount> to bet on Team 2")
-                await self._connection.send(f"PRIVMSG #{self.channel_name} :New users get 1000 points! Betting closes in {duration} seconds!")
+            self.team_totals = {"1": 0, "2": 0}
+            self._bet_team_of = {}
+            
+            # Queue battle and betting announcement
+            self._queue_msg("🎲 NEW BATTLE BETTING STARTED! 🎲")
+            self._queue_msg(f"⚔️ {title}")
+            self._queue_msg(f"Team 1: {option1}")
+            self._queue_msg(f"Team 2: {option2}")
+            self._queue_msg("Type !bet 1 <amount> to bet on Team 1")
+            self._queue_msg("Type !bet 2 <amount> to bet on Team 2")
+            self._queue_msg(f"New users get 1000 points! Betting closes in {duration} seconds!")
+            
+            # Betting is open whether or not the rate-limited announcement has gone out yet
+            try:
+                await self._flush_outbox()
+            except Exception as e:
+                log.exception("Error announcing betting: %s", e)
             
             return True
             
-        except asyncio.TimeoutError:
-            print("Timeout while creating battle poll")
-            self.betting_active = False
-            self.current_bets = {"1": {}, "2": {}}
-            return False
         except Exception as e:
-            print(f"Error creating betting: {e}")
-            traceback.print_exc()
+            log.exception("Error creating betting: %s", e)
             self.betting_active = False
             self.current_bets = {"1": {}, "2": {}}
+            self.team_totals = {"1": 0, "2": 0}
+            self._bet_team_of = {}
+            self._outbox.clear()
             return False
 
     async def handle_battle_result(self, winner, p1, p2):
@@ -1436,18 +1690,17 @@ class TwitchBot(commands.Bot):
             losing_team = "2" if winning_team == "1" else "1"
             
             # Calculate total pools
-            winning_pool = sum(self.current_bets[winning_team].values())
-            losing_pool = sum(self.current_bets[losing_team].values())
+            winning_pool = self.team_totals[winning_team]
+            losing_pool = self.team_totals[losing_team]
             total_pool = winning_pool + losing_pool
             
             # Track winners and their earnings
             winners_earnings = []
             
-            # Announce results with timeout
-            async with asyncio.timeout(5):
-                await self._connection.send(f"PRIVMSG #{self.channel_name} :🏆 Battle Results! 🏆")
-                await self._connection.send(f"PRIVMSG #{self.channel_name} :Winner: {winner_text}")
-                await self._connection.send(f"PRIVMSG #{self.channel_name} :Defeated: {loser_text}")
+            # Queue result announcement
+            self._queue_msg("🏆 Battle Results! 🏆")
+            self._queue_msg(f"Winner: {winner_text}")
+            self._queue_msg(f"Defeated: {loser_text}")
             
             if total_pool > 0:
                 # Calculate payout ratio
@@ -1456,169 +1709,357 @@ class TwitchBot(commands.Bot):
                 else:
                     payout_ratio = 2.0  # Default 2x payout if no winners
                 
-                # Distribute winnings with timeout
-                async with asyncio.timeout(10):
-                    for user, bet in self.current_bets[winning_team].items():
-                        winnings = int(bet * payout_ratio)
-                        self.user_points[user] = self.user_points.get(user, 0) + winnings
-                        winners_earnings.append((user, winnings, bet))
-                        await self._connection.send(
-                            f"PRIVMSG #{self.channel_name} :💰 {user} won {winnings:,} points! "
-                            f"(Bet: {bet:,}, Payout: {payout_ratio:.2f}x)"
-                        )
+                # Distribute winnings
+                for user, bet in self.current_bets[winning_team].items():
+                    winnings = int(bet * payout_ratio)
+                    self.user_points[user] += winnings
+                    winners_earnings.append((user, winnings, bet))
+                    self._queue_msg(
+                        f"💰 {user} won {winnings:,} points! "
+                        f"(Bet: {bet:,}, Payout: {payout_ratio:.2f}x)"
+                    )
                 
                 # Save updated points
                 self.save_user_points()
             else:
-                await self._connection.send(f"PRIVMSG #{self.channel_name} :No bets were placed on this battle!")
+                self._queue_msg("No bets were placed on this battle!")
             
-            # Announce top winners with timeout
+            # Queue top winners
             if winners_earnings:
-                winners_earnings.sort(key=lambda x: x[1], reverse=True)
-                async with asyncio.timeout(5):
-                    await self._connection.send(f"PRIVMSG #{self.channel_name} :🎰 Top Winners 🎰")
-                    for i, (user, winnings, bet) in enumerate(winners_earnings[:3], 1):
-                        profit = winnings - bet
-                        if i == 1:
-                            await self._connection.send(
-                                f"PRIVMSG #{self.channel_name} :🥇 {user} - Won: {winnings:,} points "
-                                f"(Profit: {profit:,}) 🎊"
-                            )
-                        elif i == 2:
-                            await self._connection.send(
-                                f"PRIVMSG #{self.channel_name} :🥈 {user} - Won: {winnings:,} points "
-                                f"(Profit: {profit:,})"
-                            )
-                        else:
-                            await self._connection.send(
-                                f"PRIVMSG #{self.channel_name} :🥉 {user} - Won: {winnings:,} points "
-                                f"(Profit: {profit:,})"
-                            )
-            
-        except asyncio.TimeoutError:
-            print("Timeout while handling battle result")
+                top_winners = heapq.nlargest(3, winners_earnings, key=lambda x: x[1])
+                self._queue_msg("🎰 Top Winners 🎰")
+                for i, (user, winnings, bet) in enumerate(top_winners, 1):
+                    profit = winnings - bet
+                    if i == 1:
+                        self._queue_msg(f"🥇 {user} - Won: {winnings:,} points (Profit: {profit:,}) 🎊")
+                    elif i == 2:
+                        self._queue_msg(f"🥈 {user} - Won: {winnings:,} points (Profit: {profit:,})")
+                    else:
+                        self._queue_msg(f"🥉 {user} - Won: {winnings:,} points (Profit: {profit:,})")
+            
         except Exception as e:
-            print(f"Error handling battle result: {e}")
-            traceback.print_exc()
+            log.exception("Error handling battle result: %s", e)
+            self._outbox.clear()
+            return
         finally:
-            # Always reset betting state
+            # Always reset betting state before the (possibly slow) rate-limited announcement
             self.betting_active = False
             self.current_bets = {"1": {}, "2": {}}
+            self.team_totals = {"1": 0, "2": 0}
+            self._bet_team_of = {}
+        
+        # Send everything; the outbox is emptied up front, so a failed send drops the rest
+        try:
+            await self._flush_outbox()
+        except Exception as e:
+            log.exception("Error announcing battle result: %s", e)
+
+    def _queue_msg(self, text):
+        """Queue a chat message for the next outbox flush"""
+        self._outbox.append(text)
+
+    def _pack_messages(self, texts):
+        """Join chat messages into as few PRIVMSG lines as the message length limit allows"""
+        lines = []
+        current = ""
+        for text in texts:
+            if current and len(current) + len(self.MESSAGE_SEPARATOR) + len(text) > self.MAX_MESSAGE_CHARS:
+                lines.append(current)
+                current = text
+            else:
+                current = f"{current}{self.MESSAGE_SEPARATOR}{text}" if current else text
+        if current:
+            lines.append(current)
+        return [f"PRIVMSG #{self.channel_name} :{line}" for line in lines]
+
+    async def _flush_outbox(self):
+        """Send all queued chat messages, packed into few lines, within the chat rate limit"""
+        texts = list(self._outbox)
+        self._outbox.clear()
+        for line in self._pack_messages(texts):
+            await self._send_line(line)
+
+    def _reply(self, text):
+        """Queue a command reply for the reply writer (one message per line)"""
+        for line in text.splitlines():
+            self._out_queue.put_nowait(line)
+
+    async def _reply_writer(self):
+        """Send queued command replies, packing everything waiting into as few lines as possible"""
+        while True:
+            texts = [await self._out_queue.get()]
+            try:
+                while True:
+                    texts.append(self._out_queue.get_nowait())
+            except asyncio.QueueEmpty:
+                pass
+            
+            try:
+                for line in self._pack_messages(texts):
+                    await self._send_line(line, reserve=self.ANNOUNCE_RESERVE)
+            except Exception as e:
+                print(f"Error sending command replies: {e}")
+
+    async def _wait_send_slot(self, reserve=0):
+        """Wait until the chat rate limit allows another message, leaving reserve tokens unused"""
+        limit = self.CHAT_RATE_MOD_MSGS if self._is_mod else self.CHAT_RATE_MSGS
+        while True:
+            # Refill tokens for the time elapsed since the last check
+            now = time.monotonic()
+            elapsed = now - self._send_refill_at
+            self._send_refill_at = now
+            self._send_tokens = min(limit, self._send_tokens + elapsed * limit / self.CHAT_RATE_WINDOW)
+            if self._send_tokens >= 1 + reserve:
+                self._send_tokens -= 1
+                return
+            await asyncio.sleep((1 + reserve - self._send_tokens) * self.CHAT_RATE_WINDOW / limit)
+
+    async def _send_line(self, line, reserve=0):
+        """Send a single IRC line once the chat rate limit allows it"""
+        await self._wait_send_slot(reserve)
+        await self._connection.send(line)
 
-    def load_user_points(self) -> dict:
-        """Load user points from file"""
+    def load_user_points(self) -> defaultdict:
+        """Load user points from file (missing users default to 0 points)"""
         try:
             if self.user_points_file.exists():
-                with open(self.user_points_file, 'r') as f:
-                    return json.load(f)
+                return defaultdict(int, _json_load(self.user_points_file))
         except Exception as e:
             print(f"Error loading user points: {e}")
-        return {}
+        return defaultdict(int)
 
-    def save_user_points(self):
-        """Save user points to file"""
+    def save_user_points(self, points=None) -> bool:
+        """Save user points (or a snapshot of them) to file, returning whether it succeeded"""
         try:
-            with open(self.user_points_file, 'w') as f:
-                json.dump(self.user_points, f, indent=2)
+            _json_save(self.user_points_file, self.user_points if points is None else points)
+            return True
         except Exception as e:
             print(f"Error saving user points: {e}")
+            return False
+
+    async def _point_saver(self):
+        """Periodically save user points if any bets changed them"""
+        while True:
+            await asyncio.sleep(self.POINTS_SAVE_INTERVAL)
+            if self._points_dirty:
+                # Snapshot on the loop so bets can keep adding users while the thread writes
+                self._points_dirty = False
+                snapshot = dict(self.user_points)
+                if not await asyncio.to_thread(self.save_user_points, snapshot):
+                    self._points_dirty = True
+
+    async def close(self):
+        """Flush pending point changes before shutting down the bot"""
+        if self._writer_task is not None:
+            self._writer_task.cancel()
+            self._writer_task = None
+        if self._save_task is not None:
+            self._save_task.cancel()
+            self._save_task = None
+        if self._points_dirty:
+            self._points_dirty = False
+            self.save_user_points()
+        await super().close()
 
     @commands.command(name="bet")
     async def bet_command(self, ctx, team: str, amount: str):
         """Handle betting command"""
         if not self.betting_active:
-            await ctx.send("No active betting at the moment!")
+            self._reply("No active betting at the moment!")
             return
 
         try:
-            # Convert amount to integer
+            # Validate with a cheap string check before converting to integer
+            if not amount.removeprefix('-').isdecimal():
+                self._reply("Invalid bet amount!")
+                return
             bet_amount = int(amount)
             if bet_amount <= 0:
-                await ctx.send("Bet amount must be positive!")
+                self._reply("Bet amount must be positive!")
                 return
 
+            name = ctx.author.name
+            pts = self.user_points
+
             # Initialize new users with 1000 points
-            if ctx.author.name not in self.user_points:
-                self.user_points[ctx.author.name] = 1000
-                await ctx.send(f"Welcome {ctx.author.name}! You received 1000 starting points!")
-                self.save_user_points()
+            balance = pts.get(name)
+            if balance is None:
+                balance = pts[name] = 1000
+                self._reply(f"Welcome {name}! You received 1000 starting points!")
+                self._points_dirty = True
 
             # Check if user has enough points
-            if bet_amount > self.user_points[ctx.author.name]:
-                await ctx.send(f"Not enough points! You have {self.user_points[ctx.author.name]} points.")
+            if bet_amount > balance:
+                self._reply(f"Not enough points! You have {balance} points.")
                 return
 
             # Place bet
             if team in ["1", "2"]:
+                totals = self.team_totals
+
                 # Remove any existing bet
-                for team_bets in self.current_bets.values():
-                    if ctx.author.name in team_bets:
-                        old_bet = team_bets.pop(ctx.author.name)
-                        self.user_points[ctx.author.name] += old_bet
+                prev_team = self._bet_team_of.get(name)
+                if prev_team is not None:
+                    old_bet = self.current_bets[prev_team].pop(name)
+                    pts[name] += old_bet
+                    totals[prev_team] -= old_bet
 
                 # Place new bet
-                self.current_bets[team][ctx.author.name] = bet_amount
-                self.user_points[ctx.author.name] -= bet_amount
-                await ctx.send(f"{ctx.author.name} bet {bet_amount} points on Team {team}!")
-                self.save_user_points()
+                self.current_bets[team][name] = bet_amount
+                self._bet_team_of[name] = team
+                totals[team] += bet_amount
+                pts[name] -= bet_amount
+                self._reply(f"{name} bet {bet_amount} points on Team {team}!")
+                self._points_dirty = True
 
                 # Update bet totals in GUI
-                team1_total = sum(self.current_bets["1"].values())
-                team2_total = sum(self.current_bets["2"].values())
-
-                # Update preview tab totals
-                if hasattr(self.battle_gui, 'preview_team1_total'):
-                    self.battle_gui.preview_team1_total.config(text=f"{team1_total:,}")
-                if hasattr(self.battle_gui, 'preview_team2_total'):
-                    self.battle_gui.preview_team2_total.config(text=f"{team2_total:,}")
+                self.battle_gui.post_twitch_event("totals", totals["1"], totals["2"])
             else:
-                await ctx.send("Invalid team! Use 1 or 2.")
+                self._reply("Invalid team! Use 1 or 2.")
 
         except ValueError:
-            await ctx.send("Invalid bet amount!")
+            self._reply("Invalid bet amount!")
 
     @commands.command(name="points")
     async def points_command(self, ctx):
         """Show user's points"""
-        points = self.user_points.get(ctx.author.name, 1000)
-        if ctx.author.name not in self.user_points:
-            self.user_points[ctx.author.name] = points
-            await ctx.send(f"Welcome {ctx.author.name}! You received 1000 starting points!")
+        name = ctx.author.name
+        pts = self.user_points
+        existing = pts.get(name)
+        if existing is None:
+            pts[name] = 1000
+            self._points_dirty = True
+            self._reply(f"Welcome {name}! You received 1000 starting points!")
         else:
-            await ctx.send(f"{ctx.author.name}, you have {points} points!")
+            self._reply(f"{name}, you have {existing} points!")
 
     @commands.command(name="help")
     async def help_command(self, ctx):
         """Show available commands"""
-        help_text = "Available commands:\n" + "\n".join(self.commands_list)
-        await ctx.send(help_text)
+        self._reply(self._help_text)
 
     @commands.command(name="stats")
     async def stats_command(self, ctx):
         """Show current battle statistics"""
-        if self.battle_gui.manager.current_battle:
-            battle = self.battle_gui.manager.current_battle
-            if battle["mode"] == "single":
-                await ctx.send(f"Current Battle: {battle['p1']} vs {battle['p2']} on {battle['stage']}")
-            else:
-                team1 = " & ".join(battle['p1'])
-                team2 = " & ".join(battle['p2'])
-                await ctx.send(f"Current Battle: Team {team1} vs Team {team2} on {battle['stage']}")
+        battle = self.battle_gui.manager.current_battle
+        if battle:
+            # Format the description once per battle and cache it on the battle dict
+            display = battle.get("_display")
+            if display is None:
+                if battle["mode"] == "single":
+                    display = f"Current Battle: {battle['p1']} vs {battle['p2']} on {battle['stage']}"
+                else:
+                    team1 = " & ".join(battle['p1'])
+                    team2 = " & ".join(battle['p2'])
+                    display = f"Current Battle: Team {team1} vs Team {team2} on {battle['stage']}"
+                battle["_display"] = display
+            self._reply(display)
         else:
-            await ctx.send("No battle in progress")
+            self._reply("No battle in progress")
 
     async def end_poll(self):
         """End the current betting period"""
         try:
             if self.betting_active:
-                await self._connection.send(f"PRIVMSG #{self.channel_name} :⚠️ BETTING IS NOW CLOSED! ⚠️")
+                await self._send_line(f"PRIVMSG #{self.channel_name} :⚠️ BETTING IS NOW CLOSED! ⚠️")
                 self.betting_active = False
         except Exception as e:
-            print(f"Error ending poll: {e}")
-            traceback.print_exc()
+            log.exception("Error ending poll: %s", e)
             self.betting_active = False
 
+class _Toast(tk.Toplevel):
+    """Borderless notification near the top-right of the main window that closes itself"""
+    def __init__(self, master, title, text, duration=5000):
+        super().__init__(master)
+        self.overrideredirect(True)
+        self.attributes('-topmost', True)
+        
+        frame = ttk.Frame(self, padding=10, relief='solid', borderwidth=1)
+        frame.pack(fill='both', expand=True)
+        ttk.Label(frame, text=title, font=("Arial", 10, "bold")).pack(anchor='w')
+        ttk.Label(frame, text=text, justify='left').pack(anchor='w', pady=(5, 0))
+        
+        # Place in the top-right corner of the main window
+        self.update_idletasks()
+        x = master.winfo_rootx() + master.winfo_width() - self.winfo_reqwidth() - 20
+        y = master.winfo_rooty() + 20
+        self.geometry(f"+{max(x, 0)}+{max(y, 0)}")
+        
+        # Close on click or after the timeout
+        self.bind('<Button-1>', lambda e: self.destroy())
+        self.after(duration, self.destroy)
+
+
+class _VirtualTreeview:
+    """Show a window of rows from a Python list in a Treeview, inserting only the rows that fit"""
+    __slots__ = ('tree', 'rows', 'offset', 'scroll_step', 'row_height', '_shown')
+    
+    def __init__(self, tree, scroll_step=3):
+        self.tree = tree
+        self.rows = []  # (iid, values) pairs in display order
+        self.offset = 0
+        self.scroll_step = scroll_step
+        self._shown = []  # iids currently inserted in the tree
+        
+        # Fall back to the default row height if the theme doesn't report one
+        try:
+            self.row_height = int(ttk.Style().lookup('Treeview', 'rowheight')) or 20
+        except (ValueError, tk.TclError):
+            self.row_height = 20
+        
+        # Repaginate on resize and scroll
+        tree.bind('<Configure>', lambda e: self.render(), add='+')
+        tree.bind('<MouseWheel>', self._on_wheel)
+        tree.bind('<Button-4>', self._on_wheel)
+        tree.bind('<Button-5>', self._on_wheel)
+
+    def window_size(self):
+        """Number of rows that fit in the tree below the heading row"""
+        height = self.tree.winfo_height()
+        if height <= 1:
+            return 30  # Not laid out yet
+        return max(1, height // self.row_height - 1)
+
+    def set_rows(self, rows):
+        """Replace the backing rows and redraw the current window"""
+        self.rows = rows
+        self.render()
+
+    def render(self):
+        """Insert, update and remove tree items so only the visible window is present"""
+        size = self.window_size()
+        self.offset = max(0, min(self.offset, len(self.rows) - size))
+        window = self.rows[self.offset:self.offset + size]
+        
+        # Drop rows that scrolled out of view
+        keep = {iid for iid, _ in window}
+        stale = [iid for iid in self._shown if iid not in keep]
+        if stale:
+            self.tree.delete(*stale)
+        shown = set(self._shown) - set(stale)
+        
+        # Insert or update the visible rows in order
+        for index, (iid, values) in enumerate(window):
+            if iid in shown:
+                self.tree.item(iid, values=values)
+                self.tree.move(iid, '', index)
+            else:
+                self.tree.insert('', index, iid=iid, values=values)
+        self._shown = [iid for iid, _ in window]
+
+    def _on_wheel(self, event):
+        """Scroll the window by a few rows"""
+        up = event.num == 4 or getattr(event, 'delta', 0) > 0
+        offset = self.offset + (-self.scroll_step if up else self.scroll_step)
+        if offset != self.offset:
+            self.offset = offset
+            self.render()
+        return 'break'
+
+
 class BattleGUI:
+    CONTINUOUS_DELAY = 3  # seconds between continuous battles
+    
     def __init__(self, manager):
         """Initialize the Battle GUI"""
         self.manager = manager
@@ -1651,15 +2092,103 @@ class BattleGUI:
         
         # Initialize Twitch bot (set to None by default)
         self.twitch_bot = None
+        self._twitch_loop = None  # Shared asyncio loop for Twitch bots, started on first connect
+        self._twitch_tasks = set()  # Running fire-and-forget tasks on that loop
         self.twitch_connected_var = tk.BooleanVar(value=False)
         
         # Initialize continuous battles
         self.continuous_battles = False
         self.continuous_battles_var = tk.BooleanVar(value=self.continuous_battles)
+        self._continuous_evt = threading.Event()  # Mirrors continuous_battles for the poll worker
+        
+        # Settings saved to config.json
+        self.local_betting_enabled_var = tk.BooleanVar(value=self.manager.local_betting_enabled)
+        self.tab_order = None  # Tab order loaded from config.json
+        self._config_dirty = False  # Set when a saved setting changes; checked by the autosave timer
+        self._last_twitch_connected = None  # Twitch status currently shown
+        self._cfg_template = {
+            "enabled_characters": [],
+            "enabled_stages": [],
+            "battle_mode": "single",
+            "ai_level": "4",
+            "random_stage": True,
+            "continuous_mode": False,
+            "autosave": True,
+            "tab_order": None,
+            "betting_enabled": False,
+            "betting_duration": "30",
+            "local_betting_enabled": True,
+            "local_user_points": {"Player": 1000},
+            "tournament_size": 8
+        }
         
         # Tournament state
         self.tournament = None
         self.tournament_running = False
+        self._last_bracket_lines = []  # Lines currently shown in the bracket display
+        self._tournament_events = queue.Queue()  # Worker threads report tournament progress here
+        
+        # Worker thread for slow jobs that must not block the Tk main loop
+        self._executor = ThreadPoolExecutor(max_workers=1)
+        
+        # Battle result polling runs on a worker thread and reports ("result", ...) and
+        # ("next",) events through this queue
+        self._battle_q = queue.Queue()
+        self._battle_poll_thread = None
+        
+        # Betting countdown runs against a deadline and redraws at most this often
+        self._ui_redraw_min_ms = 100
+        self._betting_deadline = 0.0
+        self._betting_shown_seconds = None
+        
+        # Config snapshots are written by a single background writer
+        self._save_q = queue.Queue()
+        self._last_cfg_hash = None  # Digest of the last config.json contents written
+        self._save_thread = threading.Thread(target=self._config_writer, daemon=True)
+        self._save_thread.start()
+        
+        # Preview widgets are created in setup_gui
+        self.preview_timer = None
+        self.preview_team1_total = None
+        self.preview_team2_total = None
+        self._last_team_totals = {"1": -1, "2": -1}  # Totals currently shown in the preview labels
+        self._betting_ui_pending = False  # Coalesces betting UI refreshes
+        self._pending_preview = None  # Battle whose team displays are not built yet
+        self._team_displays = {}  # Reusable team display widgets by side
+        
+        # Twitch bot thread reports status changes through this queue
+        self._twitch_events = queue.Queue()
+        
+        # Sorted character roster and lowercase names, built on first use
+        self._char_cache = None
+        self._char_cache_lower = None
+        self._char_cache_set = frozenset()
+        self._stage_cache = None  # Sorted stage list, built on first use
+        
+        # List repopulation and autosave requests coalesced into one flush
+        self._pending_refresh = {'stage': False, 'char': False}
+        self._pending_save = False
+        self._flush_after_id = None
+        self._visible_chars = set()  # Characters attached to the tree
+        self._detached_chars = set()  # Characters hidden by the search filter
+        self._filter_after_id = None  # Pending debounced search filter
+        self._last_search = None  # Search text the tree was last filtered with
+        self._filtered_chars = None  # (name, casefolded name) pairs matching _last_search
+        
+        # Tab drag state and the tab midpoints cached for the current drag
+        self._drag_data = {"dragging": False, "tab": None}
+        self._drag_midpoints = []
+        self._drag_indexes = []
+        self._drag_tab_ids = ()
+        
+        # Current Treeview sort columns and orders
+        self._char_sort_column = None
+        self._char_sort_order = 'asc'
+        self._stats_sort_column = None
+        self._stats_sort_order = 'asc'
+        self._stats_tiers = {}  # Tier shown for each character in the stats tree
+        self._stats_values = {}  # Stats tree row values by character
+        self._stats_orders = {}  # Ascending character order per sort column, reset on repopulate
         
         # Create placeholder images
         self._create_placeholder_images()
@@ -1668,14 +2197,27 @@ class BattleGUI:
         try:
             self.load_config()
         except Exception as e:
-            print(f"Error loading config: {e}")
-            traceback.print_exc()
+            log.exception("Error loading config: %s", e)
         
         # Setup GUI components
         self.setup_gui()
         
+        # Team displays for a new battle are built when the Preview tab is shown
+        self.notebook.bind('<<NotebookTabChanged>>', self._maybe_render_preview, add='+')
+        
+        # Mark the config dirty whenever a saved setting variable changes
+        for var in (self.mode_var, self.ai_level_var, self.random_stage_var,
+                    self.continuous_battles_var, self.betting_enabled_var,
+                    self.betting_duration_var, self.local_betting_enabled_var,
+                    self.tournament_size_var):
+            var.trace_add('write', self._mark_config_dirty)
+        
         # Start auto-save timer
         self.start_auto_save_timer()
+        
+        # Poll for events from the Twitch bot and tournament threads
+        self.root.after(50, self._drain_twitch_events)
+        self.root.after(50, self._drain_tournament_events)
 
     def setup_gui(self):
         """Setup the main GUI window"""
@@ -1699,6 +2241,9 @@ class BattleGUI:
         for name, frame in self.tabs.items():
             self.notebook.add(frame, text=name)
             
+        # Map notebook tab ids back to the self.tabs keys saved in tab_order
+        self._tab_name_by_id = {str(frame): name for name, frame in self.tabs.items()}
+            
         # Setup individual tabs
         self._setup_preview_tab()
         self._setup_battle_tab()
@@ -1804,29 +2349,44 @@ class BattleGUI:
                 )
                 return
             
-            # Select random characters for tournament
-            tournament_chars = random.sample(enabled_chars, size)
+            # Build the tournament off the Tk thread
+            self.start_tournament_btn.config(state='disabled')
+            self.tournament_status.config(text="Preparing tournament...")
+            future = self._executor.submit(self._build_tournament, enabled_chars, size)
+            future.add_done_callback(functools.partial(self.post_tournament_event, "ready"))
             
-            # Create tournament
-            from tournament import MugenTournament
-            self.tournament = MugenTournament(self.manager, tournament_chars)
+        except Exception as e:
+            messagebox.showerror("Error", f"Failed to start tournament: {str(e)}")
+            log.exception("Tournament start error: %s", e)
+            self.start_tournament_btn.config(state='normal')
+
+    def _build_tournament(self, enabled_chars, size):
+        """Pick random characters and create the tournament (runs on a worker thread)"""
+        from tournament import MugenTournament
+        tournament_chars = random.sample(enabled_chars, size)
+        return MugenTournament(self.manager, tournament_chars)
+
+    def _tournament_ready(self, future):
+        """Finish starting a tournament once it has been built"""
+        try:
+            self.tournament = future.result()
+            self.tournament.on_match_complete = functools.partial(self.post_tournament_event, "match", self.tournament)
             self.tournament_running = True
             
             # Update UI
-            self.start_tournament_btn.config(state='disabled')
             self.stop_tournament_btn.config(state='normal')
             self.tournament_status.config(text="Tournament started")
             
             # Update bracket display
             self._update_bracket_display()
             
-            # Start tournament monitor
-            self._monitor_tournament()
+            # Start the first match
+            self._advance_tournament()
             
         except Exception as e:
             messagebox.showerror("Error", f"Failed to start tournament: {str(e)}")
-            print(f"Tournament start error: {e}")
-            traceback.print_exc()
+            log.exception("Tournament start error: %s", e)
+            self.start_tournament_btn.config(state='normal')
 
     def _stop_tournament(self):
         """Stop the current tournament"""
@@ -1834,21 +2394,28 @@ class BattleGUI:
             return
             
         if messagebox.askyesno("Confirm", "Stop current tournament? This cannot be undone."):
-            self.tournament = None
-            self.tournament_running = False
-            
-            # Update UI
-            self.start_tournament_btn.config(state='normal')
-            self.stop_tournament_btn.config(state='disabled')
-            self.tournament_status.config(text="Tournament stopped")
-            
-            # Clear bracket display
-            self.bracket_display.configure(state='normal')
-            self.bracket_display.delete('1.0', tk.END)
-            self.bracket_display.configure(state='disabled')
+            self._end_tournament("Tournament stopped")
 
-    def _monitor_tournament(self):
-        """Monitor tournament progress and update display"""
+    def _end_tournament(self, status):
+        """Tear down the current tournament and show why it ended"""
+        if self.tournament:
+            self.tournament.stop()
+        self.tournament = None
+        self.tournament_running = False
+        
+        # Update UI
+        self.start_tournament_btn.config(state='normal')
+        self.stop_tournament_btn.config(state='disabled')
+        self.tournament_status.config(text=status)
+        
+        # Clear bracket display
+        self.bracket_display.configure(state='normal')
+        self.bracket_display.delete('1.0', tk.END)
+        self.bracket_display.configure(state='disabled')
+        self._last_bracket_lines = []
+
+    def _advance_tournament(self):
+        """Start the next tournament match, or finish up if the tournament is complete"""
         if not self.tournament_running or not self.tournament:
             return
             
@@ -1865,7 +2432,7 @@ class BattleGUI:
                 self.stop_tournament_btn.config(state='disabled')
                 return
             
-            # Check if we need to start a new match
+            # Start the next match; its result arrives via _handle_match_result
             if not self.tournament.current_battle:
                 match_info = self.tournament.start_next_match()
                 if match_info:
@@ -1873,18 +2440,64 @@ class BattleGUI:
                         text=f"Current Match:\n{match_info['p1']} vs {match_info['p2']}"
                     )
             
-            # Check current match result
-            result = self.tournament.check_match_result()
+        except Exception as e:
+            log.exception("Tournament error: %s", e)
+            self.tournament_status.config(text=f"Tournament error: {e}")
+
+    def post_tournament_event(self, kind, *args):
+        """Queue a tournament event for the UI thread; safe to call from any thread"""
+        self._tournament_events.put((kind, args))
+
+    def _drain_tournament_events(self):
+        """Handle every queued tournament event, then poll again"""
+        try:
+            while True:
+                kind, args = self._tournament_events.get_nowait()
+                try:
+                    if kind == "ready":
+                        self._tournament_ready(*args)
+                    elif kind == "match":
+                        # Ignore results from a tournament that has since been stopped
+                        tournament, raw_result = args
+                        if tournament is self.tournament:
+                            self._handle_match_result(raw_result)
+                except Exception as e:
+                    log.exception("Error handling tournament event %s: %s", kind, e)
+        except queue.Empty:
+            pass
+        self.root.after(50, self._drain_tournament_events)
+
+    def _handle_match_result(self, raw_result):
+        """Handle a finished tournament match reported by the tournament's watcher"""
+        if not self.tournament_running or not self.tournament:
+            return
+            
+        try:
+            # Update stats and the bracket here on the Tk thread
+            result = self.manager.apply_battle_result(raw_result)
             if result:
+                self.tournament.apply_match_result(result)
                 self._update_bracket_display()
+                self._advance_tournament()
+                return
             
-            # Continue monitoring
-            self.root.after(1000, self._monitor_tournament)
+            # The match ended without a result, so restart it a limited number of times
+            if not self.tournament.abort_match():
+                print("Tournament match ended without a result too many times, stopping tournament")
+                self._end_tournament("Tournament stopped: match ended without a result "
+                                     f"{self.tournament.MAX_MATCH_RETRIES + 1} times")
+                return
+            
+            retry = self.tournament.match_retries
+            self.tournament_status.config(
+                text=f"Match ended without a result, restarting "
+                     f"({retry}/{self.tournament.MAX_MATCH_RETRIES})..."
+            )
+            self.root.after(3000, self._advance_tournament)
             
         except Exception as e:
-            print(f"Tournament monitor error: {e}")
-            traceback.print_exc()
-            self.root.after(1000, self._monitor_tournament)
+            log.exception("Tournament error: %s", e)
+            self.tournament_status.config(text=f"Tournament error: {e}")
 
     def _update_bracket_display(self):
         """Update the tournament bracket display"""
@@ -1893,47 +2506,59 @@ class BattleGUI:
             
         try:
             # Get bracket display text
-            bracket_text = self.tournament.get_bracket_display()
+            new_lines = self.tournament.get_bracket_display().split("\n")
+            old_lines = self._last_bracket_lines
+            if new_lines == old_lines:
+                return
             
-            # Update text widget
+            # Update text widget, rewriting only the lines that changed
             self.bracket_display.configure(state='normal')
-            self.bracket_display.delete('1.0', tk.END)
-            self.bracket_display.insert('1.0', bracket_text)
+            common = min(len(old_lines), len(new_lines))
+            for i in range(common):
+                if old_lines[i] != new_lines[i]:
+                    self.bracket_display.delete(f'{i + 1}.0', f'{i + 1}.end')
+                    self.bracket_display.insert(f'{i + 1}.0', new_lines[i])
+            
+            if len(new_lines) > common:
+                # Append any new lines
+                tail = "\n".join(new_lines[common:])
+                self.bracket_display.insert('end-1c', "\n" + tail if common else tail)
+            elif len(old_lines) > common:
+                # Drop lines that are no longer present
+                self.bracket_display.delete(f'{common}.end', 'end-1c')
+            
             self.bracket_display.configure(state='disabled')
+            self._last_bracket_lines = new_lines
             
         except Exception as e:
-            print(f"Error updating bracket display: {e}")
-            traceback.print_exc()
+            log.exception("Error updating bracket display: %s", e)
 
     def _create_placeholder_images(self):
         """Create simple placeholder images"""
         try:
-            # Create solid color images
+            # Create one solid color image, filled with the prebuilt dark background and white border
             self.placeholder_char = tk.PhotoImage(master=self.root, width=200, height=200)
-            self.placeholder_stage = tk.PhotoImage(master=self.root, width=200, height=200)
-            
-            # Create a dark background with white border
-            for y in range(200):
-                for x in range(200):
-                    # Dark gray background
-                    color = '#333333'
-                    # White border (10 pixels thick)
-                    if x < 10 or x > 189 or y < 10 or y > 189:
-                        color = '#ffffff'
-                    self.placeholder_char.put(color, (x, y))
-                    self.placeholder_stage.put(color, (x, y))
+            self.placeholder_char.put(_PLACEHOLDER_DATA)
+            
+            # Character and stage placeholders are identical, so share the image
+            self.placeholder_stage = self.placeholder_char
+            
+            # Checkmark shown in the tree column for enabled characters and stages
+            check = Image.new('RGBA', (16, 16), (0, 0, 0, 0))
+            ImageDraw.Draw(check).line([(3, 8), (6, 12), (13, 3)], fill=(0, 160, 0, 255), width=2)
+            self.check_image = ImageTk.PhotoImage(check, master=self.root)
             
             # Store references to prevent garbage collection
-            self._placeholder_images = [self.placeholder_char, self.placeholder_stage]
+            self._placeholder_images = [self.placeholder_char, self.check_image]
             print("Successfully created placeholder images")
             
         except Exception as e:
-            print(f"Error creating placeholder images: {e}")
-            traceback.print_exc()
+            log.exception("Error creating placeholder images: %s", e)
             # Create minimal fallback images
             self.placeholder_char = tk.PhotoImage(master=self.root, width=1, height=1)
-            self.placeholder_stage = tk.PhotoImage(master=self.root, width=1, height=1)
-            self._placeholder_images = [self.placeholder_char, self.placeholder_stage]
+            self.placeholder_stage = self.placeholder_char
+            self.check_image = self.placeholder_char
+            self._placeholder_images = [self.placeholder_char]
 
     def _setup_preview_tab(self):
         """Setup the preview tab with character and stage displays"""
@@ -2113,7 +2738,7 @@ class BattleGUI:
         self.team1_bet_button = ttk.Button(
             bet_buttons_frame,
             text="Bet on Team 1",
-            command=lambda: self._place_local_bet("1")
+            command=functools.partial(self._place_local_bet, "1")
         )
         self.team1_bet_button.pack(side='left', expand=True, padx=5)
         
@@ -2121,12 +2746,12 @@ class BattleGUI:
         self.team2_bet_button = ttk.Button(
             bet_buttons_frame,
             text="Bet on Team 2",
-            command=lambda: self._place_local_bet("2")
+            command=functools.partial(self._place_local_bet, "2")
         )
         self.team2_bet_button.pack(side='right', expand=True, padx=5)
 
     def _create_fighter_display(self, parent, fighter, team_name, side):
-        """Create a display for a single fighter"""
+        """Create a display for a single fighter, returning its frame and name label"""
         frame = ttk.Frame(parent, style='Preview.TFrame')
         frame.pack(side=side, padx=5, pady=5)
         
@@ -2147,88 +2772,113 @@ class BattleGUI:
         )
         name.pack(pady=2)
         
-        return frame
+        return frame, name
 
     def _create_team_display(self, parent, team, team_name, side):
-        """Create a display for a team of fighters"""
-        # Clear existing widgets
-        for widget in parent.winfo_children():
-            widget.destroy()
-        
-        # Add team name
-        team_label = ttk.Label(
-            parent,
-            text=team_name,
-            style='Preview.TLabel',
-            font=("Arial", 14, "bold")
-        )
-        team_label.pack(pady=5)
-        
-        # Create frame for fighters
-        fighters_frame = ttk.Frame(parent, style='Preview.TFrame')
-        fighters_frame.pack(expand=True, fill='both')
-        
-        # Add fighters (or placeholder if empty)
-        if not team:
-            self._create_fighter_display(fighters_frame, None, team_name, side)
+        """Create a display for a team of fighters, reusing the widgets from the last battle"""
+        display = self._team_displays.get(side)
+        if display is None or display['parent'] is not parent:
+            # Clear existing widgets
+            for widget in parent.winfo_children():
+                widget.destroy()
+            
+            # Add team name
+            team_label = ttk.Label(
+                parent,
+                text=team_name,
+                style='Preview.TLabel',
+                font=("Arial", 14, "bold")
+            )
+            team_label.pack(pady=5)
+            
+            # Create frame for fighters
+            fighters_frame = ttk.Frame(parent, style='Preview.TFrame')
+            fighters_frame.pack(expand=True, fill='both')
+            
+            display = {'parent': parent, 'label': team_label, 'fighters_frame': fighters_frame,
+                       'slots': [], 'shown': 0}
+            self._team_displays[side] = display
         else:
-            for fighter in team:
-                self._create_fighter_display(fighters_frame, fighter, team_name, side)
+            display['label'].configure(text=team_name)
+        
+        # Add fighters (or placeholder if empty), creating slots only when the team grows
+        fighters = team or [None]
+        slots = display['slots']
+        while len(slots) < len(fighters):
+            slots.append(self._create_fighter_display(display['fighters_frame'], None, team_name, side))
+            
+        for index, fighter in enumerate(fighters):
+            frame, name = slots[index]
+            name.configure(text=fighter if fighter else "???")
+            if index >= display['shown']:
+                frame.pack(side=side, padx=5, pady=5)
+                
+        # Hide slots left over from a larger team
+        for frame, _ in slots[len(fighters):display['shown']]:
+            frame.pack_forget()
+        display['shown'] = len(fighters)
 
     def _update_betting_timer(self, remaining):
+        """Start the betting countdown; the battle starts when it runs out"""
+        self._betting_deadline = time.monotonic() + remaining
+        self._betting_shown_seconds = None
+        self._tick_betting_timer()
+
+    def _tick_betting_timer(self):
         """Update betting timer and start battle when done"""
         try:
-            if remaining > 0:
-                # Update timer text
-                timer_text = f"Betting closes in: {remaining} seconds"
-                
-                # Update timer in preview tab
-                if hasattr(self, 'preview_timer'):
-                    self.preview_timer.config(text=timer_text)
+            left = self._betting_deadline - time.monotonic()
+            if left > 0:
+                # Only touch the label when the displayed seconds change
+                seconds = int(left) + (left % 1 > 0)
+                if seconds != self._betting_shown_seconds:
+                    self._betting_shown_seconds = seconds
+                    if self.preview_timer is not None:
+                        self.preview_timer.config(text=f"Betting closes in: {seconds} seconds")
                 
-                # Schedule next update
-                self.root.after(1000, lambda: self._update_betting_timer(remaining - 1))
+                # Wake up when the next second ticks over, but no faster than the redraw cap
+                delay = int((left - (seconds - 1)) * 1000)
+                self.root.after(max(self._ui_redraw_min_ms, delay), self._tick_betting_timer)
             else:
                 # End Twitch betting poll if it exists
-                if hasattr(self, 'twitch_bot') and self.twitch_bot and hasattr(self.twitch_bot, 'betting_active') and self.twitch_bot.betting_active:
-                    asyncio.run_coroutine_threadsafe(
-                        self.twitch_bot.end_poll(),
-                        self.twitch_bot.loop
-                    )
+                bot = self.twitch_bot
+                if bot and bot.betting_active:
+                    self._submit_twitch(bot.end_poll())
                 
                 # End local betting
-                if hasattr(self.manager, 'local_betting_active') and self.manager.local_betting_active:
+                if self.manager.local_betting_active:
                     self.manager.end_local_betting()
                     self._update_local_betting_ui(betting_active=False)
                 
                 # Update preview tab status
-                if hasattr(self, 'preview_timer'):
+                if self.preview_timer is not None:
                     self.preview_timer.config(text="BATTLE STARTING!")
                 
                 # Start the actual battle with the stored battle info
                 self._start_actual_battle(self.current_battle_info)
                 
         except Exception as e:
-            print(f"Timer update error: {e}")
-            traceback.print_exc()
+            log.exception("Timer update error: %s", e)
             
     def _place_local_bet(self, team):
         """Place a local bet on the specified team"""
         try:
             # Get bet amount
-            try:
-                amount = int(self.bet_amount_var.get())
-            except ValueError:
+            amount_text = self.bet_amount_var.get().strip()
+            if not amount_text.removeprefix('-').isdecimal():
                 messagebox.showerror("Invalid Bet", "Please enter a valid bet amount")
                 return
+            amount = int(amount_text)
                 
             # Place bet
             username = "Player"  # Default username
             success = self.manager.place_local_bet(username, team, amount)
             
             if success:
+                self._config_dirty = True
+                
                 # Update UI
-                self._update_local_betting_ui()
+                self._queue_betting_ui_update()
                 messagebox.showinfo("Bet Placed", f"Bet of {amount} placed on Team {team}")
             else:
                 if not self.manager.local_betting_active:
@@ -2239,9 +2889,20 @@ class BattleGUI:
                     messagebox.showerror("Invalid Bet", "Unable to place bet")
                     
         except Exception as e:
-            print(f"Error placing bet: {e}")
-            traceback.print_exc()
+            log.exception("Error placing bet: %s", e)
             
+    def _queue_betting_ui_update(self):
+        """Schedule a betting UI refresh, coalescing bursts to at most 10 per second"""
+        if self._betting_ui_pending:
+            return
+        self._betting_ui_pending = True
+        self.root.after(100, self._flush_betting_ui)
+
+    def _flush_betting_ui(self):
+        """Run a queued betting UI refresh"""
+        self._betting_ui_pending = False
+        self._update_local_betting_ui()
+
     def _update_local_betting_ui(self, betting_active=None):
         """Update the local betting UI with current stats"""
         try:
@@ -2271,8 +2932,7 @@ class BattleGUI:
             self.team2_bet_button.config(state=state)
             
         except Exception as e:
-            print(f"Error updating betting UI: {e}")
-            traceback.print_exc()
+            log.exception("Error updating betting UI: %s", e)
             
     def _toggle_local_betting(self):
         """Toggle local betting on/off"""
@@ -2292,8 +2952,7 @@ class BattleGUI:
                 self.team2_bet_button.config(state=state)
                 
         except Exception as e:
-            print(f"Error toggling local betting: {e}")
-            traceback.print_exc()
+            log.exception("Error toggling local betting: %s", e)
             
     def _reset_local_betting_points(self):
         """Reset local betting points"""
@@ -2304,29 +2963,28 @@ class BattleGUI:
                 
             # Reset points
             self.manager.local_user_points = {"Player": 1000}  # Default user with 1000 points
+            self._config_dirty = True
             
             # Update UI if we're in preview tab
             if hasattr(self, 'user_points_label'):
                 self.user_points_label.config(text="Your Points: 1000")
                 
-            messagebox.showinfo("Points Reset", "Betting points have been reset to default values.")
+            _Toast(self.root, "Points Reset", "Betting points have been reset to default values.")
             
         except Exception as e:
-            print(f"Error resetting betting points: {e}")
-            traceback.print_exc()
+            log.exception("Error resetting betting points: %s", e)
 
     def _process_local_betting_results(self, battle_result):
         """Process local betting results after a battle"""
         try:
             print("Processing local betting results...")
             
-            if not hasattr(self.manager, 'local_betting_enabled') or not self.manager.local_betting_enabled:
+            if not self.manager.local_betting_enabled:
                 print("Local betting is disabled, skipping processing")
                 return
                 
             # Check for either active betting or pending bet results
-            if not (hasattr(self.manager, 'local_betting_active') and self.manager.local_betting_active) and \
-               not (hasattr(self.manager, 'pending_bet_results') and self.manager.pending_bet_results):
+            if not self.manager.local_betting_active and not self.manager.pending_bet_results:
                 print("No active betting session or pending bets, skipping processing")
                 return
                 
@@ -2341,21 +2999,23 @@ class BattleGUI:
             # Process results
             results = self.manager.process_local_betting_results(winning_team)
             print(f"Betting results: {results}")
+            self._config_dirty = True
             
             # Show results if there were any bets
             if results["winning_pool"] > 0 or results["losing_pool"] > 0:
-                result_text = f"Team {winning_team} won!\n\n"
+                parts = [f"Team {winning_team} won!\n\n"]
                 
                 if results["winners"]:
-                    result_text += f"Payout: {results.get('payout_ratio', 0):.2f}x\n\n"
-                    result_text += "Winners:\n"
-                    
-                    for winner in results["winners"]:
-                        result_text += f"{winner['username']}: {winner['bet']} → {winner['winnings']} (+{winner['profit']})\n"
+                    parts.append(f"Payout: {results.get('payout_ratio', 0):.2f}x\n\n")
+                    parts.append("Winners:\n")
+                    parts.extend(
+                        f"{winner['username']}: {winner['bet']} → {winner['winnings']} (+{winner['profit']})\n"
+                        for winner in results["winners"]
+                    )
                 else:
-                    result_text += "No winners this round."
+                    parts.append("No winners this round.")
                     
-                messagebox.showinfo("Betting Results", result_text)
+                _Toast(self.root, "Betting Results", "".join(parts))
             else:
                 print("No bets were placed for this battle")
                 
@@ -2363,8 +3023,7 @@ class BattleGUI:
             self._update_local_betting_ui(betting_active=False)
             
         except Exception as e:
-            print(f"Error processing betting results: {e}")
-            traceback.print_exc()
+            log.exception("Error processing betting results: %s", e)
 
     def _setup_draggable_tabs(self):
         """Setup drag and drop functionality for tabs"""
@@ -2375,10 +3034,6 @@ class BattleGUI:
     def _start_tab_drag(self, event):
         """Start tab dragging"""
         try:
-            # Initialize drag data if not exists
-            if not hasattr(self, '_drag_data'):
-                self._drag_data = {}
-            
             # Get tab number
             try:
                 index = self.notebook.index("@%d,%d" % (event.x, event.y))
@@ -2386,90 +3041,91 @@ class BattleGUI:
                     "tab": index,
                     "dragging": True
                 })
+                self._cache_tab_bounds()
             except tk.TclError:
                 pass
                 
         except Exception as e:
-            print("Error starting tab drag: %s" % str(e))
-            traceback.print_exc()
+            log.exception("Error starting tab drag: %s", e)
 
     def _drag_tab(self, event):
         """Handle tab dragging"""
         try:
-            if not hasattr(self, '_drag_data') or not self._drag_data.get("dragging"):
+            if not self._drag_data["dragging"]:
                 return
                 
             # Get current tab
-            x, y = event.x_root, event.y_root
-            src_tab = self._drag_data.get("tab")
-            
-            # Find target position
-            for i, tab_id in enumerate(self.notebook.tabs()):
-                bbox = self.notebook.bbox(tab_id)
-                if bbox:
-                    tab_x = bbox[0] + self.notebook.winfo_rootx()
-                    if x < tab_x + bbox[2]//2:
-                        if src_tab != i:
-                            self._move_tab(src_tab, i)
-                            self._drag_data["tab"] = i
-                        break
+            x = event.x_root
+            src_tab = self._drag_data["tab"]
+            
+            # Find the first tab whose midpoint is right of the cursor
+            pos = bisect.bisect_right(self._drag_midpoints, x)
+            if pos < len(self._drag_indexes):
+                i = self._drag_indexes[pos]
+                if src_tab != i:
+                    self._move_tab(self._drag_tab_ids[src_tab], i)
+                    self._drag_data["tab"] = i
+                    self._cache_tab_bounds()
                         
         except Exception as e:
-            print("Error dragging tab: %s" % str(e))
-            traceback.print_exc()            
+            log.exception("Error dragging tab: %s", e)
+
+    def _cache_tab_bounds(self):
+        """Cache the screen x midpoints of the tabs for the current drag"""
+        root_x = self.notebook.winfo_rootx()
+        self._drag_tab_ids = self.notebook.tabs()
+        self._drag_midpoints = []
+        self._drag_indexes = []
+        for i, tab_id in enumerate(self._drag_tab_ids):
+            bbox = self.notebook.bbox(tab_id)
+            if bbox:
+                self._drag_midpoints.append(root_x + bbox[0] + bbox[2]//2)
+                self._drag_indexes.append(i)
+
     def _release_tab(self, event):
         """Handle tab release after drag"""
         try:
-            if hasattr(self, '_drag_data') and self._drag_data.get("dragging"):
+            if self._drag_data["dragging"]:
                 self._drag_data["dragging"] = False
                 self._update_tab_references()
         except Exception as e:
-            print("Error releasing tab: %s" % str(e))
-            traceback.print_exc()
+            log.exception("Error releasing tab: %s", e)
 
-    def _move_tab(self, src, dst):
-        """Move a tab from source to destination index"""
+    def _move_tab(self, tab_id, dst):
+        """Move a tab, given by its widget or widget id, to the destination index"""
         try:
-            tab = self.notebook.tabs()[src]
-            self.notebook.insert(dst, tab)
+            self.notebook.insert(dst, tab_id)
         except Exception as e:
-            print(f"Error moving tab: {e}")
-            traceback.print_exc()
+            log.exception("Error moving tab: %s", e)
             
     def _update_tab_references(self):
         """Update tab references after drag and drop"""
         try:
             # Get the current tab order
-            tab_order = []
-            for tab_id in self.notebook.tabs():
-                tab_text = self.notebook.tab(tab_id, "text")
-                tab_order.append(tab_text)
+            tab_order = self._current_tab_names()
             
             # Update settings
             self.settings["tab_order"] = tab_order
             
-            # Save if auto-save enabled
-            if self.settings.get("autosave", True):
-                self.save_config()
+            # Save on the next flush
+            self._schedule_refresh()
                 
         except Exception as e:
-            print("Error updating tab references: %s" % str(e))
-            traceback.print_exc()
+            log.exception("Error updating tab references: %s", e)
             
+    def _current_tab_names(self):
+        """Get the tab names in their current notebook order"""
+        # Tabs are only added in setup_gui, so the id -> name map built there stays valid
+        name_by_id = self._tab_name_by_id
+        return [name_by_id[tab_id] for tab_id in self.notebook.tabs() if tab_id in name_by_id]
+
     def _save_tab_order(self, auto_save=True):
         """Save current tab order to settings"""
         try:
             if not hasattr(self, 'settings'):
                 self.settings = {}
                 
-            tab_order = []
-            for tab in self.notebook.tabs():
-                try:
-                    tab_text = self.notebook.tab(tab, "text")
-                    if tab_text:  # Only add valid tab texts
-                        tab_order.append(tab_text)
-                except tk.TclError:
-                    continue
+            tab_order = self._current_tab_names()
             
             self.settings["tab_order"] = tab_order
             
@@ -2478,55 +3134,148 @@ class BattleGUI:
                 self.save_config()
                 
         except Exception as e:
-            print(f"Error saving tab order: {e}")
-            traceback.print_exc()
+            log.exception("Error saving tab order: %s", e)
+
+    def _get_char_roster(self):
+        """Get the cached sorted character list and matching lowercase names"""
+        if self._char_cache is None:
+            self._char_cache = tuple(self.manager.scan_characters())
+            self._char_cache_lower = [char.casefold() for char in self._char_cache]
+            self._char_cache_set = frozenset(self._char_cache)
+        return self._char_cache, self._char_cache_lower
+
+    def _on_search_changed(self, *args):
+        """Debounce search typing so a burst of keystrokes filters once"""
+        if self._filter_after_id is not None:
+            self.root.after_cancel(self._filter_after_id)
+        self._filter_after_id = self.root.after(150, self._filter_characters)
+
+    def _mark_config_dirty(self, *args):
+        """Note that a saved setting changed since the last save"""
+        self._config_dirty = True
+
+    def _schedule_refresh(self, kind=None, save=True):
+        """Queue a list repopulation and/or autosave for the next UI flush"""
+        if kind:
+            self._pending_refresh[kind] = True
+        if save:
+            self._pending_save = True
+            self._config_dirty = True
+        if self._flush_after_id is None:
+            self._flush_after_id = self.root.after(20, self._flush_ui)
+
+    def _flush_ui(self):
+        """Run the queued list repopulations and autosave once"""
+        self._flush_after_id = None
+        try:
+            if self._pending_refresh['char']:
+                self._pending_refresh['char'] = False
+                self._populate_character_list()
+            if self._pending_refresh['stage']:
+                self._pending_refresh['stage'] = False
+                self._populate_stage_list()
+                
+            # Save if auto-save enabled
+            if self._pending_save:
+                self._pending_save = False
+                if self.settings.get("autosave", True):
+                    self.save_config()
+                    
+        except Exception as e:
+            log.exception("Error refreshing lists: %s", e)
+
+    def _get_stage_roster(self):
+        """Get the cached sorted stage list"""
+        if self._stage_cache is None:
+            self._stage_cache = tuple(self.manager.scan_stages())
+        return self._stage_cache
+
+    def _refresh_character_list(self):
+        """Rescan the characters folder and repopulate the character list"""
+        self._char_cache = None
+        self._schedule_refresh('char', save=False)
+
+    def _refresh_stage_list(self):
+        """Rescan the stages folder and repopulate the stage list"""
+        self._stage_cache = None
+        self._schedule_refresh('stage', save=False)
 
     def _filter_characters(self, *args):
         """Filter characters based on search text"""
+        self._filter_after_id = None
         try:
-            search_text = self.char_search_var.get().lower()
+            search_text = self.char_search_var.get().casefold()
+            if search_text == self._last_search:
+                return
+            previous_search = self._last_search
+            self._last_search = search_text
+            names, lowers = self._get_char_roster()
             
-            # Clear existing items
-            for item in self.character_tree.get_children():
-                self.character_tree.delete(item)
+            # Narrow the previous matches when the search text was only extended
+            if previous_search is not None and self._filtered_chars is not None and search_text.startswith(previous_search):
+                candidates = self._filtered_chars
+            else:
+                candidates = list(zip(names, lowers))
+            
+            # Find matching characters
+            if search_text:
+                self._filtered_chars = [(char, lower) for char, lower in candidates if search_text in lower]
+                matches = [char for char, _ in self._filtered_chars]
+            else:
+                self._filtered_chars = None
+                matches = names
+            new_visible = set(matches)
+            
+            # Skip the update if the same characters are already listed
+            if new_visible == self._visible_chars:
+                return
+            
+            # Hide characters that no longer match
+            hidden = self._visible_chars - new_visible
+            if hidden:
+                self.character_tree.detach(*hidden)
+                self._detached_chars |= hidden
             
             # Get character stats
             char_stats = self.manager.character_stats
-            enabled_chars = self.manager.settings.get("enabled_characters", [])
+            enabled_chars = self.manager.enabled_characters
             
-            # Add filtered characters
-            for char in sorted(self.manager.scan_characters()):
-                # Skip if doesn't match search
-                if search_text and search_text not in char.lower():
+            # Show newly matching characters in roster order
+            for index, char in enumerate(matches):
+                if char in self._visible_chars:
+                    continue
+                if char in self._detached_chars:
+                    self.character_tree.move(char, '', index)
+                    self._detached_chars.discard(char)
                     continue
                     
                 stats = char_stats.get(char, {"wins": 0, "losses": 0})
-                total_matches = stats["wins"] + stats["losses"]
-                win_rate = f"{(stats['wins']/total_matches)*100:.1f}%" if total_matches > 0 else "0.0%"
+                win_rate = _win_rate_and_tier(stats["wins"], stats["losses"])[0]
                 
                 self.character_tree.insert(
                     '',
-                    'end',
+                    index,
                     iid=char,
                     values=(
-                        '✓' if char in enabled_chars else '',
                         char,
                         stats["wins"],
                         stats["losses"],
                         win_rate
-                    )
+                    ),
+                    tags=('enabled',) if char in enabled_chars else ()
                 )
+            
+            self._visible_chars = new_visible
                 
         except Exception as e:
-            print(f"Error filtering characters: {e}")
-            traceback.print_exc()
+            log.exception("Error filtering characters: %s", e)
 
     def _sort_characters(self, column):
         """Sort character list by column"""
         try:
             # Get current sort column and order
-            current_sort = getattr(self, '_char_sort_column', None)
-            current_order = getattr(self, '_char_sort_order', 'asc')
+            current_sort = self._char_sort_column
+            current_order = self._char_sort_order
             
             # Update sort order
             if current_sort == column:
@@ -2538,27 +3287,35 @@ class BattleGUI:
             self._char_sort_column = column
             self._char_sort_order = new_order
             
-            # Get all items
-            item_list = [(self.character_tree.set(item, column), item) for item in self.character_tree.get_children('')]
-            
-            # Sort items
-            if column in ('Wins', 'Losses'):
-                # Sort numerically
-                item_list.sort(key=lambda x: int(x[0]) if x[0].isdigit() else 0, reverse=(new_order == 'desc'))
-            elif column == 'Win Rate':
-                # Sort by win rate percentage
-                item_list.sort(key=lambda x: float(x[0].rstrip('%')) if x[0] != '0.0%' else 0, reverse=(new_order == 'desc'))
-            else:
-                # Sort alphabetically
-                item_list.sort(reverse=(new_order == 'desc'))
+            # Sort the listed characters (item ids are character names) by their stats
+            item_list = list(self.character_tree.get_children(''))
+            item_list.sort(key=self._char_sort_key(column), reverse=(new_order == 'desc'))
             
             # Rearrange items in sorted order
-            for index, (_, item) in enumerate(item_list):
+            for index, item in enumerate(item_list):
                 self.character_tree.move(item, '', index)
 
         except Exception as e:
-            print(f"Error sorting characters: {e}")
-            traceback.print_exc()
+            log.exception("Error sorting characters: %s", e)
+
+    def _char_sort_key(self, column):
+        """Get a sort key for a character name based on the backing stats for a column"""
+        char_stats = self.manager.character_stats
+        empty = {"wins": 0, "losses": 0}
+        
+        if column == 'wins':
+            return lambda char: char_stats.get(char, empty)["wins"]
+        if column == 'losses':
+            return lambda char: char_stats.get(char, empty)["losses"]
+        if column == 'win_rate':
+            def win_rate(char):
+                stats = char_stats.get(char, empty)
+                total_matches = stats["wins"] + stats["losses"]
+                return stats["wins"] / total_matches if total_matches > 0 else 0
+            return win_rate
+        if column == 'tier':
+            return lambda char: self._stats_tiers.get(char, '')
+        return None
 
     def _toggle_character_status(self, event):
         """Toggle character enabled/disabled status"""
@@ -2568,108 +3325,139 @@ class BattleGUI:
             if not item:
                 return
                 
-            # Get current values
-            values = list(self.character_tree.item(item)['values'])
-            char_name = values[1]  # Name is in second column
+            # Item ids are character names
+            char_name = item
             
-            # Toggle enabled status
-            enabled_chars = set(self.manager.settings.get("enabled_characters", []))
+            # Toggle enabled status in place
+            enabled_chars = self.manager.enabled_characters
             if char_name in enabled_chars:
                 enabled_chars.remove(char_name)
-                values[0] = ''  # Clear checkmark
+                tags = ()  # Clear checkmark
             else:
                 enabled_chars.add(char_name)
-                values[0] = '✓'  # Add checkmark
+                tags = ('enabled',)  # Add checkmark
             
-            # Update tree and settings
-            self.character_tree.item(item, values=values)
-            self.manager.settings["enabled_characters"] = list(enabled_chars)
+            # Update tree
+            self.character_tree.item(item, tags=tags)
             
-            # Save settings if auto-save is enabled
-            if self.settings.get("autosave", True):
-                self.save_config()
+            # Save on the next flush
+            self._schedule_refresh()
                 
         except Exception as e:
-            print(f"Error toggling character status: {e}")
-            traceback.print_exc()
+            log.exception("Error toggling character status: %s", e)
+
+    def _set_enabled_chars(self, enabled):
+        """Store the enabled character set and update only the rows that changed"""
+        self._get_char_roster()
+        previous = self.manager.enabled_characters
+        
+        # Update the checkmark column in place
+        for char in (previous ^ enabled) & self._char_cache_set:
+            self.character_tree.item(char, tags=('enabled',) if char in enabled else ())
+        
+        self.manager.settings["enabled_characters"] = enabled
+        
+        # Save on the next flush
+        self._schedule_refresh()
 
     def _select_all_chars(self):
         """Enable all characters"""
         try:
-            # Get all characters
-            all_chars = [self.character_tree.item(item)["values"][1] 
-                        for item in self.character_tree.get_children()]
-            
-            # Update settings
-            self.manager.settings["enabled_characters"] = all_chars
-            
-            # Update display
-            self._populate_character_list()
-            
-            # Save if auto-save enabled
-            if self.settings.get("autosave", True):
-                self.save_config()
+            self._get_char_roster()
+            self._set_enabled_chars(set(self._char_cache_set))
                 
         except Exception as e:
-            print(f"Error selecting all characters: {e}")
-            traceback.print_exc()
+            log.exception("Error selecting all characters: %s", e)
 
     def _deselect_all_chars(self):
         """Disable all characters"""
         try:
-            # Clear enabled characters
-            self.manager.settings["enabled_characters"] = []
-            
-            # Update display
-            self._populate_character_list()
-            
-            # Save if auto-save enabled
-            if self.settings.get("autosave", True):
-                self.save_config()
+            self._set_enabled_chars(set())
                 
         except Exception as e:
-            print(f"Error deselecting all characters: {e}")
-            traceback.print_exc()
+            log.exception("Error deselecting all characters: %s", e)
 
     def _invert_char_selection(self):
         """Invert the selection of characters"""
         try:
-            # Get all characters and currently enabled ones
-            all_chars = [self.character_tree.item(item)["values"][1] 
-                        for item in self.character_tree.get_children()]
-            enabled_chars = set(self.manager.settings.get("enabled_characters", []))
-            
-            # Invert selection
-            new_enabled = [char for char in all_chars if char not in enabled_chars]
-            self.manager.settings["enabled_characters"] = new_enabled
-            
-            # Update display
-            self._populate_character_list()
-            
-            # Save if auto-save enabled
-            if self.settings.get("autosave", True):
-                self.save_config()
+            self._get_char_roster()
+            self._set_enabled_chars(set(self._char_cache_set - self.manager.enabled_characters))
                 
         except Exception as e:
-            print(f"Error inverting character selection: {e}")
-            traceback.print_exc()
+            log.exception("Error inverting character selection: %s", e)
 
     def _check_battle_result(self):
-        """Check for battle results and update stats"""
+        """Start polling for the battle result on a worker thread"""
+        # A live poll thread already has a pump chain waiting on its outcome
+        if self._battle_poll_thread is None or not self._battle_poll_thread.is_alive():
+            self._battle_poll_thread = threading.Thread(target=self._battle_poll_worker, daemon=True)
+            self._battle_poll_thread.start()
+            self.root.after(self._ui_redraw_min_ms // 2, self._pump_battle_result)
+
+    def _battle_poll_worker(self):
+        """Poll MUGEN until the battle ends, queue the raw outcome, then pace the next continuous battle"""
         try:
-            # Check if battle is running
-            mugen_running = self.manager._check_mugen_running()
-            if not mugen_running:
-                print("MUGEN is no longer running, checking for final results...")
+            while True:
+                # Check if battle is running
+                mugen_running = self.manager._check_mugen_running()
+                if not mugen_running:
+                    print("MUGEN is no longer running, checking for final results...")
+                    
+                # Only read the result here; stats are updated on the UI thread
+                result = None
+                if self.manager.current_battle is not None:
+                    result = self.manager._read_battle_result()
+                if result or not mugen_running:
+                    # Decide now whether to follow up, so the pump knows to wait for it
+                    continue_after = bool(result) and self._continuous_evt.is_set()
+                    self._battle_q.put(("result", result, mugen_running, continue_after))
+                    
+                    # Time the gap before the next battle here rather than on the UI thread
+                    if continue_after:
+                        print(f"Continuous battles mode is enabled, starting next battle in {self.CONTINUOUS_DELAY} seconds...")
+                        time.sleep(self.CONTINUOUS_DELAY)
+                        self._battle_q.put(("next",))
+                    return
+                    
+                time.sleep(0.5)
                 
-            # Save stage information before checking result
+        except Exception as e:
+            log.exception("Error polling battle result: %s", e)
+            self._battle_q.put(("result", None, False, False))
+
+    def _pump_battle_result(self, delay=50):
+        """Handle a queued battle event, or check again with a growing interval"""
+        try:
+            kind, *args = self._battle_q.get_nowait()
+        except queue.Empty:
+            # Back off towards the worker's own 500ms poll rate while the battle runs
+            delay = min(delay * 2, 500)
+            self.root.after(delay, self._pump_battle_result, delay)
+            return
+        
+        if kind == "result":
+            raw_result, mugen_running, continue_after = args
+            self._handle_battle_result(raw_result, mugen_running)
+            if continue_after:
+                # Keep pumping until the worker says the next battle is due
+                self.root.after(500, self._pump_battle_result, 500)
+        elif kind == "next":
+            # The worker exits right after posting this, so a new poll thread can start
+            self._battle_poll_thread.join(timeout=1)
+            if self.continuous_battles_var.get():
+                self._start_battle()
+
+    def _handle_battle_result(self, raw_result, mugen_running):
+        """Update stats and UI once the battle poll has finished"""
+        try:
+            # Save stage information before the result clears current_battle
             current_stage = None
-            if hasattr(self.manager, 'current_battle') and self.manager.current_battle is not None:
-                if 'stage' in self.manager.current_battle:
-                    current_stage = self.manager.current_battle["stage"]
-                
-            # Try to get battle result
-            result = self.manager.check_battle_result()
+            current_battle = self.manager.current_battle
+            if current_battle is not None and 'stage' in current_battle:
+                current_stage = current_battle["stage"]
+            
+            # Process the result here so stats are only changed on the UI thread
+            result = self.manager.apply_battle_result(raw_result)
             if not result:
                 if not mugen_running:
                     print("No result found but MUGEN has stopped. Battle may have been terminated.")
@@ -2677,24 +3465,13 @@ class BattleGUI:
                     self.start_battle_btn.config(state='normal')
                     
                     # Make sure to clean up any active betting
-                    if hasattr(self.manager, 'local_betting_active') and self.manager.local_betting_active:
+                    if self.manager.local_betting_active:
                         print("Cleaning up active betting session")
                         self.manager.local_betting_active = False
                         self.manager.local_bets = {"1": {}, "2": {}}
+                        self.manager.local_bet_totals = {"1": 0, "2": 0}
                         self._update_local_betting_ui(betting_active=False)
                     
-                    # Make sure watcher is terminated
-                    if hasattr(self.manager, 'watcher_process') and self.manager.watcher_process:
-                        try:
-                            self.manager.watcher_process.terminate()
-                            self.manager.watcher_process = None
-                        except:
-                            pass
-                    
-                    return
-                
-                # Schedule another check
-                self.root.after(500, self._check_battle_result)
                 return
                 
             # Process battle result
@@ -2716,11 +3493,11 @@ class BattleGUI:
             self._populate_stats()
             
             # Process local betting results
-            if hasattr(self.manager, 'local_betting_enabled') and self.manager.local_betting_enabled:
+            if self.manager.local_betting_enabled:
                 self._process_local_betting_results(result)
             
             # If Twitch bot is connected, handle betting results
-            if hasattr(self, 'twitch_bot') and self.twitch_bot and hasattr(self.twitch_bot, 'connected') and self.twitch_bot.connected:
+            if self.twitch_bot and self.twitch_bot.connected:
                 try:
                     # Format team names
                     if result['mode'] == "single":
@@ -2731,49 +3508,41 @@ class BattleGUI:
                         p2_name = " & ".join(result['p2'])
                     
                     # Send result to Twitch
-                    asyncio.run_coroutine_threadsafe(
+                    self._submit_twitch(
                         self.twitch_bot.handle_battle_result(
                             result["winner"],
                             p1_name,
                             p2_name
-                        ),
-                        self.twitch_bot.loop
+                        )
                     )
                 except Exception as e:
-                    print(f"Error handling Twitch result: {e}")
-                    traceback.print_exc()
+                    log.exception("Error handling Twitch result: %s", e)
             
             # Re-enable battle button
             self.start_battle_btn.config(state='normal')
-            
-            # Make sure watcher is terminated
-            if hasattr(self.manager, 'watcher_process') and self.manager.watcher_process:
-                try:
-                    self.manager.watcher_process.terminate()
-                    self.manager.watcher_process = None
-                except:
-                    pass
                     
             print("Battle processing complete")
             
-            # Start another battle if continuous mode is enabled
-            if hasattr(self, 'continuous_battles_var') and self.continuous_battles_var.get():
-                print("Continuous battles mode is enabled, starting next battle in 3 seconds...")
-                self.root.after(3000, self._start_battle)
-            
         except Exception as e:
-            print(f"Error checking battle result: {e}")
-            traceback.print_exc()
+            log.exception("Error checking battle result: %s", e)
             
             # Re-enable battle button in case of error
             self.start_battle_btn.config(state='normal')
 
+    def _stats_order(self, column, order):
+        """Get the stats row order for a column, sorting each column at most once per repopulate"""
+        ascending = self._stats_orders.get(column)
+        if ascending is None:
+            ascending = sorted(self._stats_values, key=self._char_sort_key(column))
+            self._stats_orders[column] = ascending
+        return ascending[::-1] if order == 'desc' else ascending
+
     def _sort_stats(self, column):
         """Sort statistics list by column"""
         try:
             # Get current sort column and order
-            current_sort = getattr(self, '_stats_sort_column', None)
-            current_order = getattr(self, '_stats_sort_order', 'asc')
+            current_sort = self._stats_sort_column
+            current_order = self._stats_sort_order
             
             # Update sort order
             if current_sort == column:
@@ -2792,72 +3561,97 @@ class BattleGUI:
                 else:
                     self.stats_tree.heading(col, text=col)
             
-            # Get all items
-            item_list = [(self.stats_tree.set(item, column), item) for item in self.stats_tree.get_children('')]
-            
-            # Sort items
-            if column in ('Wins', 'Losses'):
-                # Sort numerically
-                item_list.sort(key=lambda x: int(x[0]) if x[0].isdigit() else 0, reverse=(new_order == 'desc'))
-            elif column == 'Win Rate':
-                # Sort by win rate percentage
-                item_list.sort(key=lambda x: float(x[0].rstrip('%')) if x[0] != '0.0%' else 0, reverse=(new_order == 'desc'))
-            else:
-                # Sort alphabetically
-                item_list.sort(reverse=(new_order == 'desc'))
-            
-            # Rearrange items in sorted order
-            for index, (_, item) in enumerate(item_list):
-                self.stats_tree.move(item, '', index)
+            # Sort the backing rows by their stats and redraw the visible window
+            order = self._stats_order(column, new_order)
+            self._stats_view.offset = 0
+            self._stats_view.set_rows([(char, self._stats_values[char]) for char in order])
 
         except Exception as e:
-            print(f"Error sorting stats: {e}")
-            traceback.print_exc()
+            log.exception("Error sorting stats: %s", e)
 
     def save_config(self):
         """Save application configuration to file"""
         try:
-            config = {
-                "enabled_characters": list(self.manager.settings["enabled_characters"]),
-                "enabled_stages": list(self.manager.settings["enabled_stages"]),
-                "battle_mode": self.mode_var.get() if hasattr(self, 'mode_var') else "single",
-                "ai_level": self.ai_level_var.get() if hasattr(self, 'ai_level_var') else "4",
-                "random_stage": self.random_stage_var.get() if hasattr(self, 'random_stage_var') else True,
-                "continuous_mode": self.continuous_battles_var.get() if hasattr(self, 'continuous_battles_var') else False,
-                "autosave": self.autosave_var.get() if hasattr(self, 'autosave_var') else True,
-                "tab_order": self.tab_order if hasattr(self, 'tab_order') else None,
-                "betting_enabled": self.betting_enabled_var.get() if hasattr(self, 'betting_enabled_var') else False,
-                "betting_duration": self.betting_duration_var.get() if hasattr(self, 'betting_duration_var') else "30",
-                "local_betting_enabled": self.local_betting_enabled_var.get() if hasattr(self, 'local_betting_enabled_var') else True,
-                "local_user_points": self.manager.local_user_points if hasattr(self.manager, 'local_user_points') else {"Player": 1000},
-                "tournament_size": self.tournament_size_var.get() if hasattr(self, 'tournament_size_var') else 8
-            }
-            
-            with open('config.json', 'w') as f:
-                json.dump(config, f, indent=2)
-                
-            print("Configuration saved")
+            # Refresh the reusable template in place
+            self._config_dirty = False
+            config = self._cfg_template
+            config["enabled_characters"] = list(self.manager.settings["enabled_characters"])
+            config["enabled_stages"] = list(self.manager.settings["enabled_stages"])
+            config["battle_mode"] = self.mode_var.get()
+            config["ai_level"] = self.ai_level_var.get()
+            config["random_stage"] = self.random_stage_var.get()
+            config["continuous_mode"] = self.continuous_battles_var.get()
+            config["tab_order"] = list(self.tab_order) if self.tab_order is not None else None
+            config["betting_enabled"] = self.betting_enabled_var.get()
+            config["betting_duration"] = self.betting_duration_var.get()
+            config["local_betting_enabled"] = self.local_betting_enabled_var.get()
+            config["local_user_points"] = dict(self.manager.local_user_points)
+            config["tournament_size"] = self.tournament_size_var.get()
+            
+            # Hand a snapshot to the writer thread
+            self._save_q.put(dict(config))
             
         except Exception as e:
-            print(f"Error saving configuration: {e}")
-            traceback.print_exc()
+            log.exception("Error saving configuration: %s", e)
+
+    def _config_writer(self):
+        """Write queued config snapshots, keeping only the newest of each burst"""
+        running = True
+        while running:
+            # None asks the writer to stop after the pending save
+            config = self._save_q.get()
+            running = config is not None
+            
+            # Drain anything queued meanwhile
+            while True:
+                try:
+                    newer = self._save_q.get_nowait()
+                except queue.Empty:
+                    break
+                if newer is None:
+                    running = False
+                else:
+                    config = newer
+            
+            if config is None:
+                continue
+                
+            try:
+                # Skip the write when nothing changed since the last save
+                data = _json_dumps(config)
+                digest = hashlib.blake2b(data, digest_size=16).digest()
+                if digest == self._last_cfg_hash:
+                    continue
+                    
+                _atomic_write(Path('config.json'), data)
+                self._last_cfg_hash = digest
+                print("Configuration saved")
+            except Exception as e:
+                log.exception("Error saving configuration: %s", e)
 
     def load_config(self):
         """Load application configuration from file"""
         try:
-            if not Path('config.json').exists():
+            try:
+                data = Path('config.json').read_bytes()
+            except FileNotFoundError:
                 print("No configuration file found")
                 return
-                
-            with open('config.json', 'r') as f:
-                config = json.load(f)
+            config = _json_loads(data)
+            
+            # An autosave producing the same bytes can skip the write
+            self._last_cfg_hash = hashlib.blake2b(data, digest_size=16).digest()
                 
             # Load character and stage settings
             if "enabled_characters" in config:
                 self.manager.settings["enabled_characters"] = set(config["enabled_characters"])
                 
             if "enabled_stages" in config:
-                self.manager.settings["enabled_stages"] = set(config["enabled_stages"])
+                # Older configs may list stages with a 'stages/' prefix; store the bare names
+                self.manager.settings["enabled_stages"] = {
+                    stage[7:] if stage.startswith('stages/') else stage
+                    for stage in config["enabled_stages"]
+                }
                 
             # Load battle settings
             if "battle_mode" in config and hasattr(self, 'mode_var'):
@@ -2871,7 +3665,7 @@ class BattleGUI:
                 
             if "continuous_mode" in config and hasattr(self, 'continuous_battles_var'):
                 self.continuous_battles_var.set(config["continuous_mode"])
-                self.continuous_battles = config["continuous_mode"]
+                self._toggle_continuous_battles()
                 
             if "tournament_size" in config and hasattr(self, 'tournament_size_var'):
                 self.tournament_size_var.set(config["tournament_size"])
@@ -2880,9 +3674,10 @@ class BattleGUI:
             if "autosave" in config and hasattr(self, 'autosave_var'):
                 self.autosave_var.set(config["autosave"])
                 
-            if "tab_order" in config and config["tab_order"] and hasattr(self, '_load_tab_order'):
+            if "tab_order" in config and config["tab_order"]:
                 self.tab_order = config["tab_order"]
-                self._load_tab_order()
+                if hasattr(self, 'notebook'):
+                    self._load_tab_order()
                 
             # Load Twitch settings
             if "betting_enabled" in config and hasattr(self, 'betting_enabled_var'):
@@ -2900,15 +3695,16 @@ class BattleGUI:
             if "local_user_points" in config:
                 self.manager.local_user_points = config["local_user_points"]
                 
-            # Update UI
-            self._populate_character_list()
-            self._populate_stage_list()
+            # Update UI, rescanning in case the MUGEN folders changed
+            self._char_cache = None
+            self._stage_cache = None
+            self._schedule_refresh('char', save=False)
+            self._schedule_refresh('stage', save=False)
             
             print("Configuration loaded")
             
         except Exception as e:
-            print(f"Error loading configuration: {e}")
-            traceback.print_exc()
+            log.exception("Error loading configuration: %s", e)
 
     def setup_gui(self):
         """Setup the main GUI window"""
@@ -2932,6 +3728,9 @@ class BattleGUI:
         for name, frame in self.tabs.items():
             self.notebook.add(frame, text=name)
             
+        # Map notebook tab ids back to the self.tabs keys saved in tab_order
+        self._tab_name_by_id = {str(frame): name for name, frame in self.tabs.items()}
+            
         # Setup individual tabs
         self._setup_preview_tab()
         self._setup_battle_tab()
@@ -3012,7 +3811,7 @@ class BattleGUI:
         search_label.pack(side='left', padx=5)
         
         self.char_search_var = tk.StringVar()
-        self.char_search_var.trace('w', self._filter_characters)
+        self.char_search_var.trace('w', self._on_search_changed)
         search_entry = ttk.Entry(search_frame, textvariable=self.char_search_var)
         search_entry.pack(side='left', fill='x', expand=True, padx=5)
         
@@ -3033,20 +3832,22 @@ class BattleGUI:
         invert_btn.pack(side='left', padx=5)
         
         # Create character tree
-        self.character_tree = ttk.Treeview(char_frame, columns=('enabled', 'name', 'wins', 'losses', 'win_rate'),
-                                         show='headings', selectmode='none')
+        self.character_tree = ttk.Treeview(char_frame, columns=('name', 'wins', 'losses', 'win_rate'),
+                                         show='tree headings', selectmode='none')
         
-        self.character_tree.heading('enabled', text='')
+        # The tree column shows the checkmark image of enabled rows
+        self.character_tree.tag_configure('enabled', image=self.check_image)
+        self.character_tree.heading('#0', text='')
         self.character_tree.heading('name', text='Character')
         self.character_tree.heading('wins', text='Wins')
         self.character_tree.heading('losses', text='Losses')
         self.character_tree.heading('win_rate', text='Win Rate')
         
-        self.character_tree.column('enabled', width=30, anchor='center')
-        self.character_tree.column('name', width=200)
-        self.character_tree.column('wins', width=80, anchor='center')
-        self.character_tree.column('losses', width=80, anchor='center')
-        self.character_tree.column('win_rate', width=80, anchor='center')
+        self.character_tree.column('#0', width=30, stretch=False)
+        self.character_tree.column('name', width=200, minwidth=200, stretch=False)
+        self.character_tree.column('wins', width=80, minwidth=80, anchor='center', stretch=False)
+        self.character_tree.column('losses', width=80, minwidth=80, anchor='center', stretch=False)
+        self.character_tree.column('win_rate', width=80, minwidth=80, anchor='center')
         
         self.character_tree.pack(fill='both', expand=True, padx=10, pady=5)
         
@@ -3077,18 +3878,20 @@ class BattleGUI:
         invert_btn.pack(side='left', padx=5)
         
         # Create stage tree
-        self.stage_tree = ttk.Treeview(stage_frame, columns=('enabled', 'name', 'times_used', 'last_used'),
-                                     show='headings', selectmode='none')
+        self.stage_tree = ttk.Treeview(stage_frame, columns=('name', 'times_used', 'last_used'),
+                                     show='tree headings', selectmode='none')
         
-        self.stage_tree.heading('enabled', text='')
+        # The tree column shows the checkmark image of enabled rows
+        self.stage_tree.tag_configure('enabled', image=self.check_image)
+        self.stage_tree.heading('#0', text='')
         self.stage_tree.heading('name', text='Stage')
         self.stage_tree.heading('times_used', text='Times Used')
         self.stage_tree.heading('last_used', text='Last Used')
         
-        self.stage_tree.column('enabled', width=30, anchor='center')
-        self.stage_tree.column('name', width=200)
-        self.stage_tree.column('times_used', width=100, anchor='center')
-        self.stage_tree.column('last_used', width=150, anchor='center')
+        self.stage_tree.column('#0', width=30, stretch=False)
+        self.stage_tree.column('name', width=200, minwidth=200, stretch=False)
+        self.stage_tree.column('times_used', width=100, minwidth=100, anchor='center', stretch=False)
+        self.stage_tree.column('last_used', width=150, minwidth=150, anchor='center')
         
         self.stage_tree.pack(fill='both', expand=True, padx=10, pady=5)
         
@@ -3112,17 +3915,20 @@ class BattleGUI:
         self.stats_tree.heading('win_rate', text='Win Rate')
         self.stats_tree.heading('tier', text='Tier')
         
-        self.stats_tree.column('character', width=200)
-        self.stats_tree.column('wins', width=80, anchor='center')
-        self.stats_tree.column('losses', width=80, anchor='center')
-        self.stats_tree.column('win_rate', width=80, anchor='center')
-        self.stats_tree.column('tier', width=50, anchor='center')
+        self.stats_tree.column('character', width=200, minwidth=200, stretch=False)
+        self.stats_tree.column('wins', width=80, minwidth=80, anchor='center', stretch=False)
+        self.stats_tree.column('losses', width=80, minwidth=80, anchor='center', stretch=False)
+        self.stats_tree.column('win_rate', width=80, minwidth=80, anchor='center', stretch=False)
+        self.stats_tree.column('tier', width=50, minwidth=50, anchor='center')
         
         self.stats_tree.pack(fill='both', expand=True, padx=10, pady=5)
         
+        # Only the rows that fit on screen are inserted into the tree
+        self._stats_view = _VirtualTreeview(self.stats_tree)
+        
         # Add sorting functionality
         for col in ('character', 'wins', 'losses', 'win_rate', 'tier'):
-            self.stats_tree.heading(col, command=lambda c=col: self._sort_stats(c))
+            self.stats_tree.heading(col, command=functools.partial(self._sort_stats, col))
         
         # Initial population
         self._populate_stats()
@@ -3217,8 +4023,8 @@ class BattleGUI:
         # View menu
         view_menu = tk.Menu(menubar, tearoff=0)
         menubar.add_cascade(label="View", menu=view_menu)
-        view_menu.add_command(label="Refresh Character List", command=self._populate_character_list)
-        view_menu.add_command(label="Refresh Stage List", command=self._populate_stage_list)
+        view_menu.add_command(label="Refresh Character List", command=self._refresh_character_list)
+        view_menu.add_command(label="Refresh Stage List", command=self._refresh_stage_list)
         view_menu.add_command(label="Refresh Statistics", command=self._populate_stats)
         
         # Help menu
@@ -3228,155 +4034,157 @@ class BattleGUI:
 
     def start_auto_save_timer(self):
         """Start timer for auto-saving configuration"""
-        if self.settings.get("autosave", True):
+        if self._config_dirty and self.settings.get("autosave", True):
             self.save_config()
         self.root.after(300000, self.start_auto_save_timer)  # Save every 5 minutes
 
     def run(self):
         """Start the GUI application"""
-        self.root.mainloop()
+        try:
+            self.root.mainloop()
+        finally:
+            # The watcher is kept alive between battles, so stop it on exit
+            self.manager.stop_watcher()
+            self._executor.shutdown(wait=False)
+            
+            # Let the config writer finish any pending save
+            self._save_q.put(None)
+            self._save_thread.join(timeout=5)
 
     def _populate_character_list(self):
         """Populate the character list with current data"""
-        # Clear existing items
-        for item in self.character_tree.get_children():
-            self.character_tree.delete(item)
-        
-        # Get character stats
-        char_stats = self.manager.character_stats
-        enabled_chars = self.manager.settings.get("enabled_characters", [])
+        names, _ = self._get_char_roster()
         
-        # Add characters
-        for char in sorted(self.manager.scan_characters()):
-            stats = char_stats.get(char, {"wins": 0, "losses": 0})
-            total_matches = stats["wins"] + stats["losses"]
-            win_rate = f"{(stats['wins']/total_matches)*100:.1f}%" if total_matches > 0 else "0.0%"
-            
-            self.character_tree.insert(
-                '',
-                'end',
-                iid=char,
-                values=(
-                    '✓' if char in enabled_chars else '',
-                    char,
-                    stats["wins"],
-                    stats["losses"],
-                    win_rate
+        # Unmap the tree while rebuilding so it is laid out once at the end
+        pack_info = self.character_tree.pack_info()
+        self.character_tree.pack_forget()
+        try:
+            # Clear existing items, including ones hidden by the filter
+            self.character_tree.delete(*self.character_tree.get_children(), *self._detached_chars)
+            self._visible_chars = set(names)
+            self._detached_chars = set()
+            self._last_search = None
+            self._filtered_chars = None
+            
+            # Get character stats
+            char_stats = self.manager.character_stats
+            enabled_chars = self.manager.enabled_characters
+            
+            # Add characters
+            for char in names:
+                stats = char_stats.get(char, {"wins": 0, "losses": 0})
+                win_rate = _win_rate_and_tier(stats["wins"], stats["losses"])[0]
+                
+                self.character_tree.insert(
+                    '',
+                    'end',
+                    iid=char,
+                    values=(
+                        char,
+                        stats["wins"],
+                        stats["losses"],
+                        win_rate
+                    ),
+                    tags=('enabled',) if char in enabled_chars else ()
                 )
-            )
+        finally:
+            self.character_tree.pack(**pack_info)
 
     def _populate_stage_list(self):
         """Populate the stage list with current data"""
-        # Clear existing items
-        for item in self.stage_tree.get_children():
-            self.stage_tree.delete(item)
-        
-        # Get stage stats
-        stage_stats = self.manager.stage_stats
-        enabled_stages = self.manager.settings.get("enabled_stages", [])
-        
-        # Add stages
-        for stage in sorted(self.manager.scan_stages()):
-            stats = stage_stats.get(stage, {
-                "times_used": 0,
-                "last_used": "Never",
-                "total_duration": 0
-            })
+        # Unmap the tree while rebuilding so it is laid out once at the end
+        pack_info = self.stage_tree.pack_info()
+        self.stage_tree.pack_forget()
+        try:
+            # Clear existing items
+            self.stage_tree.delete(*self.stage_tree.get_children())
+            
+            # Get stage stats
+            stage_stats = self.manager.stage_stats
+            enabled_stages = self.manager.enabled_stages
             
-            self.stage_tree.insert(
-                '',
-                'end',
-                iid=stage,
-                values=(
-                    '✓' if stage in enabled_stages else '',
-                    stage,
-                    stats["times_used"],
-                    stats["last_used"]
+            # Add stages
+            for stage in self._get_stage_roster():
+                stats = stage_stats.get(stage, {
+                    "times_used": 0,
+                    "last_used": "Never",
+                    "total_duration": 0
+                })
+                
+                self.stage_tree.insert(
+                    '',
+                    'end',
+                    iid=stage,
+                    values=(
+                        stage,
+                        stats["times_used"],
+                        stats["last_used"]
+                    ),
+                    tags=('enabled',) if stage in enabled_stages else ()
                 )
-            )
+        finally:
+            self.stage_tree.pack(**pack_info)
 
     def _populate_stats(self):
         """Populate the stats tree with current statistics"""
-        # Clear existing items
-        for item in self.stats_tree.get_children():
-            self.stats_tree.delete(item)
-        
         # Get character stats
         char_stats = self.manager.character_stats
+        self._stats_tiers = {}
+        rows = {}
         
-        # Add characters
-        for char in sorted(self.manager.scan_characters()):
+        # Build rows for every character; only the visible window is inserted
+        for char in self._get_char_roster()[0]:
             stats = char_stats.get(char, {"wins": 0, "losses": 0})
-            total_matches = stats["wins"] + stats["losses"]
-            win_rate = f"{(stats['wins']/total_matches)*100:.1f}%" if total_matches > 0 else "0.0%"
-            tier = self.manager.get_character_tier(char)
-            
-            self.stats_tree.insert(
-                '',
-                'end',
-                values=(char, stats["wins"], stats["losses"], win_rate, tier)
-            )
+            win_rate, tier = _win_rate_and_tier(stats["wins"], stats["losses"])
+            self._stats_tiers[char] = tier
+            rows[char] = (char, stats["wins"], stats["losses"], win_rate, tier)
+        self._stats_values = rows
+        self._stats_orders = {}
+        
+        # Keep the current sort order
+        order = rows
+        if self._stats_sort_column is not None:
+            order = self._stats_order(self._stats_sort_column, self._stats_sort_order)
+        self._stats_view.set_rows([(char, rows[char]) for char in order])
+
+    def _set_enabled_stages(self, enabled):
+        """Store the enabled stage set and update only the rows that changed"""
+        roster = set(self._get_stage_roster())
+        previous = self.manager.enabled_stages
+        
+        # Update the checkmark column in place
+        for stage in (previous ^ enabled) & roster:
+            self.stage_tree.item(stage, tags=('enabled',) if stage in enabled else ())
+        
+        self.manager.settings["enabled_stages"] = enabled
+        
+        # Save on the next flush
+        self._schedule_refresh()
 
     def _select_all_stages(self):
         """Enable all stages"""
         try:
-            # Get all stages
-            all_stages = [self.stage_tree.item(item)["values"][1] 
-                         for item in self.stage_tree.get_children()]
-            
-            # Update settings
-            self.manager.settings["enabled_stages"] = all_stages
-            
-            # Update display
-            self._populate_stage_list()
-            
-            # Save if auto-save enabled
-            if self.settings.get("autosave", True):
-                self.save_config()
+            self._set_enabled_stages(set(self._get_stage_roster()))
                 
         except Exception as e:
-            print(f"Error selecting all stages: {e}")
-            traceback.print_exc()
+            log.exception("Error selecting all stages: %s", e)
 
     def _deselect_all_stages(self):
         """Disable all stages"""
         try:
-            # Clear enabled stages
-            self.manager.settings["enabled_stages"] = []
-            
-            # Update display
-            self._populate_stage_list()
-            
-            # Save if auto-save enabled
-            if self.settings.get("autosave", True):
-                self.save_config()
+            self._set_enabled_stages(set())
                 
         except Exception as e:
-            print(f"Error deselecting all stages: {e}")
-            traceback.print_exc()
+            log.exception("Error deselecting all stages: %s", e)
 
     def _invert_stage_selection(self):
         """Invert the selection of stages"""
         try:
-            # Get all stages and currently enabled ones
-            all_stages = [self.stage_tree.item(item)["values"][1] 
-                         for item in self.stage_tree.get_children()]
-            enabled_stages = set(self.manager.settings.get("enabled_stages", []))
-            
-            # Invert selection
-            new_enabled = [stage for stage in all_stages if stage not in enabled_stages]
-            self.manager.settings["enabled_stages"] = new_enabled
-            
-            # Update display
-            self._populate_stage_list()
-            
-            # Save if auto-save enabled
-            if self.settings.get("autosave", True):
-                self.save_config()
+            enabled_stages = self.manager.enabled_stages
+            self._set_enabled_stages({stage for stage in self._get_stage_roster() if stage not in enabled_stages})
                 
         except Exception as e:
-            print(f"Error inverting stage selection: {e}")
-            traceback.print_exc()
+            log.exception("Error inverting stage selection: %s", e)
 
     def _toggle_stage_status(self, event):
         """Toggle stage enabled/disabled status"""
@@ -3386,30 +4194,26 @@ class BattleGUI:
             if not item:
                 return
                 
-            # Get current values
-            values = list(self.stage_tree.item(item)['values'])
-            stage_name = values[1]  # Name is in second column
+            # Item ids are stage names
+            stage_name = item
             
-            # Toggle enabled status
-            enabled_stages = set(self.manager.settings.get("enabled_stages", []))
+            # Toggle enabled status in place
+            enabled_stages = self.manager.enabled_stages
             if stage_name in enabled_stages:
                 enabled_stages.remove(stage_name)
-                values[0] = ''  # Clear checkmark
+                tags = ()  # Clear checkmark
             else:
                 enabled_stages.add(stage_name)
-                values[0] = '✓'  # Add checkmark
+                tags = ('enabled',)  # Add checkmark
             
-            # Update tree and settings
-            self.stage_tree.item(item, values=values)
-            self.manager.settings["enabled_stages"] = list(enabled_stages)
+            # Update tree
+            self.stage_tree.item(item, tags=tags)
             
-            # Save settings if auto-save is enabled
-            if self.settings.get("autosave", True):
-                self.save_config()
+            # Save on the next flush
+            self._schedule_refresh()
                 
         except Exception as e:
-            print(f"Error toggling stage status: {e}")
-            traceback.print_exc()
+            log.exception("Error toggling stage status: %s", e)
 
     def _start_battle(self):
         """Start a battle with selected characters and settings"""
@@ -3429,11 +4233,13 @@ class BattleGUI:
             # Switch to preview tab
             self.notebook.select(self.tabs['Preview'])
             
+            # Betting state is read once; all of these are created in __init__
+            bot = self.twitch_bot
+            twitch_connected = self.twitch_connected_var.get()
+            
             # Start Twitch betting if enabled
             twitch_betting_started = False
-            if (hasattr(self, 'twitch_connected_var') and self.twitch_connected_var.get() and 
-                hasattr(self, 'betting_enabled_var') and self.betting_enabled_var.get() and
-                hasattr(self, 'twitch_bot') and self.twitch_bot):
+            if twitch_connected and bot and self.betting_enabled_var.get():
                 try:
                     # Get betting duration
                     duration = int(self.betting_duration_var.get())
@@ -3447,58 +4253,41 @@ class BattleGUI:
                         team2_name = f"Team 2 ({len(battle_info['p2'])} fighters)"
                     
                     # Start betting poll
-                    asyncio.run_coroutine_threadsafe(
-                        self.twitch_bot.create_battle_poll(
+                    self._submit_twitch(
+                        bot.create_battle_poll(
                             "Who will win?", 
                             team1_name, 
                             team2_name,
                             duration
-                        ),
-                        self.twitch_bot.loop
+                        )
                     )
                     twitch_betting_started = True
                     
                 except Exception as e:
-                    print(f"Error starting Twitch betting: {e}")
-                    traceback.print_exc()
+                    log.exception("Error starting Twitch betting: %s", e)
             
             # Start local betting if enabled
-            if hasattr(self.manager, 'local_betting_enabled') and self.manager.local_betting_enabled:
+            if self.manager.local_betting_enabled:
                 try:
                     # Start local betting
                     self.manager.start_local_betting()
                     
                     # Update UI
                     self._update_local_betting_ui(betting_active=True)
-                    
-                    # Get betting duration (use same as Twitch if available)
-                    if hasattr(self, 'betting_duration_var'):
-                        duration = int(self.betting_duration_var.get())
-                    else:
-                        duration = 30  # Default duration
                         
                 except Exception as e:
-                    print(f"Error starting local betting: {e}")
-                    traceback.print_exc()
+                    log.exception("Error starting local betting: %s", e)
             
             # Start betting timer if either betting system is active
-            if (twitch_betting_started or 
-                (hasattr(self.manager, 'local_betting_active') and self.manager.local_betting_active)):
-                # Get betting duration
-                if hasattr(self, 'betting_duration_var'):
-                    duration = int(self.betting_duration_var.get())
-                else:
-                    duration = 30  # Default duration
-                
+            if twitch_betting_started or self.manager.local_betting_active:
                 # Start timer
-                self._update_betting_timer(duration)
+                self._update_betting_timer(int(self.betting_duration_var.get()))
             else:
                 # Start battle immediately if no betting
                 self._start_actual_battle(battle_info)
                 
         except Exception as e:
-            print(f"Error starting battle: {e}")
-            traceback.print_exc()
+            log.exception("Error starting battle: %s", e)
             messagebox.showerror("Battle Error", f"An error occurred: {e}")
 
     def _start_actual_battle(self, battle_info=None):
@@ -3526,24 +4315,15 @@ class BattleGUI:
                 self.battle_log.see(tk.END)
                 
         except Exception as e:
-            print(f"Error starting actual battle: {e}")
-            traceback.print_exc()
+            log.exception("Error starting actual battle: %s", e)
             self.start_battle_btn.config(state='normal')
 
     def _update_preview(self, battle_info):
         """Update the preview tab with current battle information"""
         try:
-            if battle_info['mode'] == "single":
-                # Update team displays
-                self._create_team_display(self.team1_frame, [battle_info['p1']], "Team 1", "left")
-                self._create_team_display(self.team2_frame, [battle_info['p2']], "Team 2", "right")
-            else:
-                # Update team displays for team battle
-                self._create_team_display(self.team1_frame, battle_info['p1'], "Team 1", "left")
-                self._create_team_display(self.team2_frame, battle_info['p2'], "Team 2", "right")
-            
-            # Update stage preview
-            self.stage_preview.configure(image=self.placeholder_stage)
+            # Build the team displays now only if the Preview tab is showing
+            self._pending_preview = battle_info
+            self._maybe_render_preview()
             
             # Initialize local betting UI if enabled
             if hasattr(self.manager, 'local_betting_enabled') and self.manager.local_betting_enabled:
@@ -3559,8 +4339,27 @@ class BattleGUI:
                 self.user_points_label.config(text=f"Your Points: {points}")
             
         except Exception as e:
-            print(f"Error updating preview: {e}")
-            traceback.print_exc()
+            log.exception("Error updating preview: %s", e)
+
+    def _maybe_render_preview(self, event=None):
+        """Build the pending team displays once the Preview tab is visible"""
+        battle_info = self._pending_preview
+        if battle_info is None or self.notebook.select() != str(self.tabs['Preview']):
+            return
+        self._pending_preview = None
+        
+        try:
+            if battle_info['mode'] == "single":
+                # Update team displays
+                self._create_team_display(self.team1_frame, [battle_info['p1']], "Team 1", "left")
+                self._create_team_display(self.team2_frame, [battle_info['p2']], "Team 2", "right")
+            else:
+                # Update team displays for team battle
+                self._create_team_display(self.team1_frame, battle_info['p1'], "Team 1", "left")
+                self._create_team_display(self.team2_frame, battle_info['p2'], "Team 2", "right")
+                
+        except Exception as e:
+            log.exception("Error updating preview: %s", e)
 
     def _show_about(self):
         """Show about dialog"""
@@ -3581,6 +4380,10 @@ Created with Python and Tkinter."""
     def _toggle_continuous_battles(self):
         """Toggle continuous battles mode"""
         self.continuous_battles = self.continuous_battles_var.get()
+        if self.continuous_battles:
+            self._continuous_evt.set()
+        else:
+            self._continuous_evt.clear()
         print(f"Continuous battles: {'enabled' if self.continuous_battles else 'disabled'}")
         
     def update_twitch_status(self, connected):
@@ -3589,13 +4392,17 @@ Created with Python and Tkinter."""
         Args:
             connected (bool): Whether the Twitch bot is connected
         """
+        # Nothing to redraw if the state didn't change
+        if connected == self._last_twitch_connected:
+            return
+        self._last_twitch_connected = connected
+        
         self.twitch_connected_var.set(connected)
         status = "Connected" if connected else "Disconnected"
         print(f"Twitch status: {status}")
         
         # Update any UI elements that show Twitch status
-        # This will be called from the Twitch bot thread, so we need to use after()
-        # to ensure it runs on the main thread
+        # The Twitch bot thread reaches this through post_twitch_event, so it runs on the main thread
         
         # If there's a status label in the UI, update it
         if hasattr(self, 'twitch_status_label'):
@@ -3622,16 +4429,16 @@ Created with Python and Tkinter."""
                 
             # Reset points
             self.manager.local_user_points = {"Player": 1000}  # Default user with 1000 points
+            self._config_dirty = True
             
             # Update UI if we're in preview tab
             if hasattr(self, 'user_points_label'):
                 self.user_points_label.config(text="Your Points: 1000")
                 
-            messagebox.showinfo("Points Reset", "Betting points have been reset to default values.")
+            _Toast(self.root, "Points Reset", "Betting points have been reset to default values.")
             
         except Exception as e:
-            print(f"Error resetting betting points: {e}")
-            traceback.print_exc()
+            log.exception("Error resetting betting points: %s", e)
 
     def _connect_to_twitch(self):
         """Connect to Twitch using credentials from a dialog"""
@@ -3640,13 +4447,12 @@ Created with Python and Tkinter."""
             if hasattr(self, 'twitch_bot') and self.twitch_bot:
                 # Close the connection
                 try:
-                    self.twitch_bot.loop.create_task(self.twitch_bot.close())
+                    self._submit_twitch(self.twitch_bot.close())
                     self.twitch_bot = None
                     self.update_twitch_status(False)
-                    self.twitch_connect_button.config(text="Connect to Twitch")
+                    self._reset_twitch_button()
                 except Exception as e:
-                    print(f"Error disconnecting from Twitch: {e}")
-                    traceback.print_exc()
+                    log.exception("Error disconnecting from Twitch: %s", e)
             return
             
         # Show dialog to get Twitch credentials
@@ -3694,11 +4500,11 @@ Created with Python and Tkinter."""
             
             # Connect to Twitch
             try:
-                # Initialize the bot
-                self.twitch_bot = TwitchBot(token, channel, self, username)
+                # Initialize the bot on the shared Twitch event loop
+                self.twitch_bot = TwitchBot(token, channel, self, username, loop=self._ensure_twitch_loop())
                 
-                # Start the bot in a separate thread
-                threading.Thread(target=self._run_twitch_bot, daemon=True).start()
+                # Start the bot as a task on that loop
+                self._submit_twitch(self._run_twitch_bot(self.twitch_bot))
                 
                 # Update button text
                 self.twitch_connect_button.config(text="Disconnect from Twitch")
@@ -3708,8 +4514,7 @@ Created with Python and Tkinter."""
                 
             except Exception as e:
                 messagebox.showerror("Connection Error", f"Failed to connect to Twitch: {e}")
-                print(f"Error connecting to Twitch: {e}")
-                traceback.print_exc()
+                log.exception("Error connecting to Twitch: %s", e)
                 self.twitch_bot = None
         
         def on_cancel():
@@ -3726,43 +4531,142 @@ Created with Python and Tkinter."""
         y = (dialog.winfo_screenheight() // 2) - (height // 2)
         dialog.geometry(f"{width}x{height}+{x}+{y}")
         
-    def _run_twitch_bot(self):
-        """Run the Twitch bot in a separate thread"""
+    def _submit_twitch(self, coro):
+        """Schedule a coroutine on the Twitch bot loop without waiting for it"""
+        # Nobody waits on the result, so skip the concurrent Future wrapper
+        self._twitch_loop.call_soon_threadsafe(self._start_twitch_task, coro)
+
+    def _start_twitch_task(self, coro):
+        """Create a Twitch task on the bot loop and report its failure when it finishes"""
+        # The loop only holds tasks weakly, so keep each one alive until it is done
+        task = self._twitch_loop.create_task(coro)
+        self._twitch_tasks.add(task)
+        task.add_done_callback(self._on_twitch_task_done)
+
+    def _on_twitch_task_done(self, task):
+        """Log the exception of a finished Twitch task, which nobody else retrieves"""
+        self._twitch_tasks.discard(task)
+        if task.cancelled():
+            return
+        error = task.exception()
+        if error is not None:
+            log.error("Twitch task failed: %s", error, exc_info=error)
+        
+    def _ensure_twitch_loop(self):
+        """Get the Twitch event loop, starting its thread on first use"""
+        if self._twitch_loop is None:
+            self._twitch_loop = asyncio.new_event_loop()
+            threading.Thread(target=self._twitch_loop_worker, args=(self._twitch_loop,),
+                             name="twitch-loop", daemon=True).start()
+        return self._twitch_loop
+
+    def _twitch_loop_worker(self, loop):
+        """Run the shared Twitch event loop for the lifetime of the app"""
+        asyncio.set_event_loop(loop)
+        loop.run_forever()
+
+    async def _run_twitch_bot(self, bot):
+        """Connect a Twitch bot on the shared loop"""
         try:
-            # Run the bot
-            self.twitch_bot.run()
+            # The connection's keep-alive keeps running as a task on this loop
+            await bot.connect()
         except Exception as e:
-            print(f"Error running Twitch bot: {e}")
-            traceback.print_exc()
+            log.exception("Error running Twitch bot: %s", e)
             
-            # Update status on the main thread
-            self.root.after(0, self.update_twitch_status, False)
-            self.root.after(0, lambda: self.twitch_connect_button.config(text="Connect to Twitch"))
-            self.twitch_bot = None
+            # Reset the Twitch UI from the main thread
+            self.post_twitch_event("stopped", bot, str(e))
+
+    def post_twitch_event(self, kind, *args):
+        """Queue a Twitch event for the UI thread; safe to call from any thread"""
+        self._twitch_events.put((kind, args))
+
+    def _drain_twitch_events(self):
+        """Handle every queued Twitch event, then poll again"""
+        try:
+            while True:
+                kind, args = self._twitch_events.get_nowait()
+                try:
+                    if kind == "status":
+                        self.update_twitch_status(*args)
+                    elif kind == "totals":
+                        self._show_twitch_totals(*args)
+                    elif kind == "stopped":
+                        self._on_twitch_disconnected(*args)
+                except Exception as e:
+                    log.exception("Error handling Twitch event %s: %s", kind, e)
+        except queue.Empty:
+            pass
+        self.root.after(50, self._drain_twitch_events)
+
+    def _show_twitch_totals(self, team1_total, team2_total):
+        """Update preview tab totals, skipping labels whose value is unchanged"""
+        shown = self._last_team_totals
+        if team1_total != shown["1"]:
+            shown["1"] = team1_total
+            if self.preview_team1_total is not None:
+                self.preview_team1_total.config(text=f"{team1_total:,}")
+        if team2_total != shown["2"]:
+            shown["2"] = team2_total
+            if self.preview_team2_total is not None:
+                self.preview_team2_total.config(text=f"{team2_total:,}")
+
+    def _on_twitch_disconnected(self, bot, error):
+        """Reset the Twitch state and controls after the bot thread stopped"""
+        # A newer connection may already have replaced this bot
+        if self.twitch_bot is not bot:
+            return
+        self.twitch_bot = None
+        self.update_twitch_status(False)
+        self._reset_twitch_button()
+        log.error("Twitch bot stopped: %s", error)
+
+    def _reset_twitch_button(self):
+        """Show the connect action on the Twitch button"""
+        self.twitch_connect_button.config(text="Connect to Twitch")
             
     def _load_tab_order(self):
         """Load and apply saved tab order"""
+        saved_order = self.settings.get("tab_order")
+        if not saved_order:
+            return
+            
         try:
-            if "tab_order" in self.settings:
-                saved_order = self.settings["tab_order"]
-                current_tabs = {}
-                
-                # Create mapping of tab text to index
-                for i in range(self.notebook.index('end')):
-                    text = self.notebook.tab(i, "text")
-                    current_tabs[text] = i
-                
-                # Reorder tabs according to saved order
-                for i, tab_text in enumerate(saved_order):
-                    if tab_text in current_tabs:
-                        current_index = current_tabs[tab_text]
-                        if current_index != i:
-                            self._move_tab(current_index, i)
-        except Exception as e:
-            print(f"Error loading tab order: {e}")
-            traceback.print_exc()
+            # Common case: nothing was reordered since the last session
+            current_order = self._current_tab_names()
+            if current_order[:len(saved_order)] == list(saved_order):
+                return
+            
+            # Work out the final order; unknown saved tabs are dropped, new tabs go last
+            saved = set(saved_order)
+            desired = ([name for name in saved_order if name in self.tabs] +
+                       [name for name in current_order if name not in saved])
+            if desired == current_order:
+                return
+            
+            # Before the window is first shown there is nothing to redraw, so just insert
+            if not self.notebook.winfo_viewable():
+                for i, name in enumerate(desired):
+                    self._move_tab(self.tabs[name], i)
+                return
+            
+            # Reinsert every tab with the notebook unmapped so layout runs once
+            pack_info = self.notebook.pack_info()
+            self.notebook.pack_forget()
+            try:
+                for i, name in enumerate(desired):
+                    self._move_tab(self.tabs[name], i)
+            finally:
+                self.notebook.pack(**pack_info)
+            self.notebook.update_idletasks()
+        except (KeyError, TypeError, tk.TclError) as e:
+            # Tk failures or a malformed saved order; anything else is a real bug
+            log.exception("Error loading tab order: %s", e)
 
 if __name__ == "__main__":
-    manager = MugenBattleManager()
-    gui = BattleGUI(manager)
-    gui.run() 
\ No newline at end of file
+    log_listener = _start_log_listener()
+    try:
+        manager = MugenBattleManager()
+        gui = BattleGUI(manager)
+        gui.run()
+    finally:
+        log_listener.stop() 
\ No newline at end of file
@@ -1,5 +1,6 @@
 import random
 import time
+import threading
 from pathlib import Path
 from typing import List, Dict, Optional
 from enum import Enum
@@ -9,6 +10,8 @@ class TournamentFormat(Enum):
     SINGLE_ELIMINATION = "Single Elimination"
 
 class MugenTournament:
+    MAX_MATCH_RETRIES = 3  # Times a match that ends without a result is restarted
+    
     def __init__(self, battle_manager, players: List[str]):
         """Initialize tournament with battle manager and players"""
         self.manager = battle_manager
@@ -22,6 +25,14 @@ class MugenTournament:
         self.matches = []
         self.results = {}
         
+        # Optional callback invoked from the watcher thread with the raw battle
+        # result (or None if the match ended without one) once a started match
+        # finishes; it should hand the result to apply_match_result on its own thread
+        self.on_match_complete = None
+        self.poll_interval = 1.0
+        self.stopped = False
+        self.match_retries = 0
+        
         # Set up the tournament bracket
         self._setup_bracket()
     
@@ -166,6 +177,10 @@ class MugenTournament:
                     
                     # Start the battle
                     self.current_battle = self.manager.start_battle(battle_info)
+                    
+                    # Wait for the result in the background if someone is listening
+                    if self.on_match_complete is not None:
+                        threading.Thread(target=self._watch_match, daemon=True).start()
                     return battle_info
                     
         return None
@@ -178,7 +193,10 @@ class MugenTournament:
         result = self.manager.check_battle_result()
         if not result:
             return None
-            
+        return self.apply_match_result(result)
+    
+    def apply_match_result(self, result: Dict) -> Dict:
+        """Record a processed battle result for the current match in the bracket"""
         # Process match result
         winner = result['winner']
         current_round = self.matches[self.current_battle['round']]
@@ -201,8 +219,34 @@ class MugenTournament:
         
         # Clear current battle
         self.current_battle = None
+        self.match_retries = 0
         
         return result
+    
+    def abort_match(self) -> bool:
+        """Drop the current match after it ended without a result, returning False once it has failed too often"""
+        self.current_battle = None
+        self.match_retries += 1
+        return self.match_retries <= self.MAX_MATCH_RETRIES
+    
+    def _watch_match(self):
+        """Wait for the current match to finish and report the raw result via on_match_complete"""
+        # Only poll here; stats and the bracket are updated by whoever receives the result
+        while self.current_battle and not self.stopped:
+            mugen_running = self.manager._check_mugen_running()
+            result = self.manager._read_battle_result()
+            if result or not mugen_running:
+                callback = self.on_match_complete
+                if callback is not None:
+                    callback(result)
+                return
+            
+            time.sleep(self.poll_interval)
+    
+    def stop(self):
+        """Stop watching for match results"""
+        self.stopped = True
+        self.on_match_complete = None
 
 def create_tournament(battle_manager, num_players: int = 8) -> MugenTournament:
     """Create a new tournament with random selection of enabled characters"""
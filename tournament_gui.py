@@ -131,9 +131,10 @@ class TournamentFrame(ttk.Frame):
 
     def _populate_characters(self):
         """Populate character list with enabled characters"""
-        for char in sorted(self.manager.characters):
-            tier = self.manager.get_character_tier(char)
-            self.char_tree.insert("", "end", values=(char, tier, ""))
+        chars = sorted(self.manager.characters)
+        tiers = self.manager.get_all_tiers(chars)
+        for char in chars:
+            self.char_tree.insert("", "end", values=(char, tiers[char], ""))
 
     def _populate_stages(self):
         """Populate stage list with enabled stages"""